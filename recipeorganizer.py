@@ -10,115 +10,416 @@ import os
 import sys
 import sqlite3
 import datetime
+import queue
+import threading
+from contextlib import contextmanager
 import customtkinter as ctk
-from tkinter import messagebox, simpledialog
+from tkinter import messagebox, simpledialog, ttk
 import tkinter.filedialog as filedialog
 import tkinter as tk
 from customtkinter import CTkScrollableFrame, CTkTextbox
 import json
 
+# orjson serializes/deserializes several times faster than the stdlib;
+# used for file import/export when installed, with json as the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure appearance mode and color theme
 ctk.set_appearance_mode("System")  # Options: "System", "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Options: "blue", "green", "dark-blue"
 
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTH_NAME = ("January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December")
+
+
+def format_db_date(value, full=False):
+    """Format a "YYYY-MM-DD HH:MM:SS" database timestamp for display.
+
+    The stored format is fixed, so slicing plus a month lookup replaces
+    strptime's locale and regex machinery on the list-refresh path. Falls
+    back to the raw string for anything unexpected.
+    """
+    try:
+        months = _MONTH_NAME if full else _MONTH_ABBR
+        return f"{months[int(value[5:7]) - 1]} {int(value[8:10])}, {value[0:4]}"
+    except (ValueError, IndexError):
+        return value
+
+
+def write_json_file(data, file_path):
+    """Write data to a JSON file, using orjson when it's available."""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=4)
+
+
+def read_json_file(file_path):
+    """Read a JSON file, using orjson when it's available."""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
 class RecipeDatabase:
     """
     Handles all database operations for the Recipe Organization System.
     """
-    
-    def __init__(self, db_path='recipe_system.db'):
-        """Initialize the database connection and create tables if they don't exist."""
+
+    # Bumped whenever schema setup needs to re-run (new tables, indexes or
+    # seed data); stored in the database via PRAGMA user_version
+    _SCHEMA_VERSION = 2
+
+    # Triggers keeping the external-content FTS index in sync with recipes;
+    # shared between schema setup and bulk_add_recipes, which drops and
+    # recreates them around large imports
+    _FTS_TRIGGER_SQL = (
+        '''
+        CREATE TRIGGER IF NOT EXISTS recipes_ai AFTER INSERT ON recipes BEGIN
+            INSERT INTO recipes_fts (rowid, name, instructions)
+            VALUES (new.id, new.name, new.instructions);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS recipes_ad AFTER DELETE ON recipes BEGIN
+            INSERT INTO recipes_fts (recipes_fts, rowid, name, instructions)
+            VALUES ('delete', old.id, old.name, old.instructions);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS recipes_au AFTER UPDATE ON recipes BEGIN
+            INSERT INTO recipes_fts (recipes_fts, rowid, name, instructions)
+            VALUES ('delete', old.id, old.name, old.instructions);
+            INSERT INTO recipes_fts (rowid, name, instructions)
+            VALUES (new.id, new.name, new.instructions);
+        END
+        ''',
+    )
+
+    # Hot insert statements used by the batched add/update helpers; reusing
+    # the same string objects keeps them pinned in the statement cache
+    # Upsert every name in one statement and get the ids back in the same
+    # pass; the no-op DO UPDATE makes existing rows show up in RETURNING too
+    _UPSERT_CATEGORY_SQL = '''
+    INSERT INTO categories (name)
+    SELECT value FROM json_each(?) WHERE true
+    ON CONFLICT (name) DO UPDATE SET name = excluded.name
+    RETURNING id
+    '''
+    _INS_RECIPE_CAT_SQL = ('INSERT OR IGNORE INTO recipe_categories '
+                           '(recipe_id, category_id) VALUES (?, ?)')
+    _INS_RECIPE_ING_SQL = ('INSERT INTO recipe_ingredients '
+                           '(recipe_id, ingredient_text) VALUES (?, ?)')
+    _INS_RECIPE_SQL = ('INSERT INTO recipes (name, instructions, favorite) '
+                       'VALUES (?, ?, ?)')
+    _UPD_RECIPE_SQL = ('UPDATE recipes SET name = ?, instructions = ?, '
+                       'favorite = ? WHERE id = ?')
+    _GET_RECIPE_SQL = '''
+    SELECT r.id, r.name, r.instructions, r.favorite, r.date_added,
+        (SELECT json_group_array(t)
+         FROM (SELECT ri.ingredient_text AS t
+               FROM recipe_ingredients ri
+               WHERE ri.recipe_id = r.id
+               ORDER BY ri.id)) AS ingredients,
+        (SELECT json_group_array(c.name)
+         FROM recipe_categories rc
+         JOIN categories c ON rc.category_id = c.id
+         WHERE rc.recipe_id = r.id) AS categories
+    FROM recipes r
+    WHERE r.id = ?
+    '''
+
+    _GET_RECIPES_BULK_SQL = '''
+    SELECT r.id, r.name, r.instructions, r.favorite, r.date_added,
+        (SELECT json_group_array(t)
+         FROM (SELECT ri.ingredient_text AS t
+               FROM recipe_ingredients ri
+               WHERE ri.recipe_id = r.id
+               ORDER BY ri.id)) AS ingredients,
+        (SELECT json_group_array(c.name)
+         FROM recipe_categories rc
+         JOIN categories c ON rc.category_id = c.id
+         WHERE rc.recipe_id = r.id) AS categories
+    FROM recipes r
+    WHERE r.id IN (SELECT value FROM json_each(?))
+    '''
+
+    def __init__(self, db_path='recipe_system.db', reader_count=4):
+        """Initialize the database connections and create tables if they don't exist."""
         # Store the database path
         self.db_path = db_path
-        
-        # Connect to the database
-        self.conn = sqlite3.connect(db_path)
-        self.cursor = self.conn.cursor()
-        
-        # Create tables if they don't exist
-        self._create_tables()
-    
+
+        # Checked before connect() creates an empty file; together with
+        # user_version below it decides whether schema setup runs at all
+        db_exists = os.path.exists(db_path)
+
+        # Single writer connection (SQLite serializes writes anyway), shared
+        # across threads and guarded by a lock. The statement cache is bumped
+        # well past the default 128 so hot SQL stays prepared under churn.
+        # isolation_level=None disables the driver's implicit transactions;
+        # writes run inside explicit BEGIN IMMEDIATE blocks via _transaction()
+        self._writer = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=512,
+            isolation_level=None
+        )
+        # Reentrant so composed write methods (imports calling add/update)
+        # can share one outer transaction instead of deadlocking
+        self._writer.row_factory = sqlite3.Row
+        self._writer_lock = threading.RLock()
+
+        # Keep the old attribute names pointing at the writer
+        self.conn = self._writer
+        self.cursor = self._writer.cursor()
+
+        # Tune the connection: WAL lets readers run alongside writes and makes
+        # commits much cheaper, foreign_keys is required for the ON DELETE
+        # CASCADE clauses in the schema to actually fire
+        if not db_exists:
+            # Larger pages pack more rows per B-tree page; only effective if
+            # set before the first write puts the database into WAL mode
+            self.cursor.execute('PRAGMA page_size=8192')
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        self.cursor.execute('PRAGMA synchronous=NORMAL')
+        self.cursor.execute('PRAGMA cache_size=-65536')
+        self.cursor.execute('PRAGMA temp_store=MEMORY')
+        self.cursor.execute('PRAGMA mmap_size=268435456')
+        self.cursor.execute('PRAGMA journal_size_limit=6144000')
+        self.cursor.execute('PRAGMA foreign_keys=ON')
+        self.cursor.execute('PRAGMA busy_timeout=5000')
+
+        # Run schema setup only when the file is new or its stored schema
+        # version is behind; a warm start costs one PRAGMA read instead of
+        # re-parsing a dozen CREATE ... IF NOT EXISTS statements
+        self.cursor.execute('PRAGMA user_version')
+        if not db_exists or self.cursor.fetchone()[0] < self._SCHEMA_VERSION:
+            self._create_tables()
+
+        # Mask 0x10002 limits optimize to tables whose statistics are
+        # missing or clearly stale, so a warm start stays cheap
+        self.cursor.execute('PRAGMA optimize=0x10002')
+
+        # Pool of read-only connections; under WAL these can run queries
+        # in parallel with each other and with the writer
+        self._readers = queue.Queue()
+        for _ in range(reader_count):
+            reader = sqlite3.connect(
+                f'file:{db_path}?mode=ro', uri=True, check_same_thread=False,
+                cached_statements=512
+            )
+            reader.row_factory = sqlite3.Row
+            reader.execute('PRAGMA busy_timeout=5000')
+            self._readers.put(reader)
+
+        # Category names change only when a write introduces a new one, but
+        # the UI re-reads them on every combobox refresh; cache the list and
+        # invalidate on the write paths that touch categories
+        self._cat_cache = None
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes as one atomic BEGIN IMMEDIATE transaction.
+
+        Takes the writer lock, starts the transaction immediately (avoiding
+        deferred-to-write lock upgrades), and commits on success or rolls
+        back if the block raises. Nested uses join the enclosing
+        transaction, so bulk callers can batch many writes into one fsync.
+        """
+        with self._writer_lock:
+            if self._writer.in_transaction:
+                yield self.cursor
+                return
+            self.cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.cursor
+            except Exception:
+                self.cursor.execute('ROLLBACK')
+                raise
+            else:
+                self.cursor.execute('COMMIT')
+
+    @contextmanager
+    def _with_reader(self):
+        """Check a read-only connection out of the pool and yield a cursor on it."""
+        reader = self._readers.get()
+        try:
+            yield reader.cursor()
+        finally:
+            self._readers.put(reader)
+
     def _create_tables(self):
         """Create all necessary tables for the application if they don't already exist."""
-        # Create recipes table (simplified)
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS recipes (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            instructions TEXT,
-            favorite BOOLEAN DEFAULT 0,
-            date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Create categories table
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS categories (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL UNIQUE
-        )
-        ''')
-        
-        # Create recipe_categories table (many-to-many relationship)
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS recipe_categories (
-            recipe_id INTEGER,
-            category_id INTEGER,
-            PRIMARY KEY (recipe_id, category_id),
-            FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE,
-            FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE CASCADE
-        )
-        ''')
-        
-        # Create ingredients table (simplified to just a string)
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS recipe_ingredients (
-            id INTEGER PRIMARY KEY,
-            recipe_id INTEGER,
-            ingredient_text TEXT,
-            FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE
-        )
-        ''')
-        
-        # Create shopping_lists table
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS shopping_lists (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # Create shopping_list_items table (simplified)
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS shopping_list_items (
-            id INTEGER PRIMARY KEY,
-            shopping_list_id INTEGER,
-            item_text TEXT,
-            checked BOOLEAN DEFAULT 0,
-            FOREIGN KEY (shopping_list_id) REFERENCES shopping_lists (id) ON DELETE CASCADE
-        )
-        ''')
-        
-        # Insert some default categories
-        default_categories = [
-            ('Breakfast',), ('Lunch',), ('Dinner',), ('Dessert',), 
-            ('Appetizer',), ('Snack',), ('Soup',), ('Salad',),
-            ('Main Course',), ('Side Dish',), ('Beverage',), ('Baked Goods',)
-        ]
-        
-        self.cursor.executemany(
-            'INSERT OR IGNORE INTO categories (name) VALUES (?)', 
-            default_categories
-        )
+        # One explicit transaction: a dozen DDL statements, the seed
+        # insert and ANALYZE all land under a single commit instead of
+        # one implicit transaction (and fsync) apiece
+        with self._transaction():
+            # Create recipes table (simplified)
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS recipes (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                instructions TEXT,
+                favorite BOOLEAN DEFAULT 0,
+                date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
         
-        # Commit changes
-        self.conn.commit()
+            # Create categories table
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS categories (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+            ''')
+        
+            # Create recipe_categories table (many-to-many relationship)
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS recipe_categories (
+                recipe_id INTEGER,
+                category_id INTEGER,
+                PRIMARY KEY (recipe_id, category_id),
+                FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE,
+                FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE CASCADE
+            )
+            ''')
+        
+            # Create ingredients table (simplified to just a string)
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS recipe_ingredients (
+                id INTEGER PRIMARY KEY,
+                recipe_id INTEGER,
+                ingredient_text TEXT,
+                FOREIGN KEY (recipe_id) REFERENCES recipes (id) ON DELETE CASCADE
+            )
+            ''')
+        
+            # Create shopping_lists table
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS shopping_lists (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                date_created TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+        
+            # Create shopping_list_items table (simplified)
+            self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS shopping_list_items (
+                id INTEGER PRIMARY KEY,
+                shopping_list_id INTEGER,
+                item_text TEXT,
+                checked BOOLEAN DEFAULT 0,
+                FOREIGN KEY (shopping_list_id) REFERENCES shopping_lists (id) ON DELETE CASCADE
+            )
+            ''')
+        
+            # Indexes for the hot query paths: category filtering in
+            # search_recipes, per-recipe ingredient lookups, favorite filtering,
+            # and per-list shopping item fetches
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_rc_cat
+            ON recipe_categories (category_id, recipe_id)
+            ''')
+            # Covering index: shopping-list generation filters on recipe_id and
+            # groups by ingredient_text, so this serves the whole query without
+            # touching the table. Supersedes the old single-column idx_ri_recipe.
+            self.cursor.execute('DROP INDEX IF EXISTS idx_ri_recipe')
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_ri_recipe_text
+            ON recipe_ingredients (recipe_id, ingredient_text)
+            ''')
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_recipes_fav_name
+            ON recipes (favorite, name)
+            ''')
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sli_list
+            ON shopping_list_items (shopping_list_id)
+            ''')
+
+            # Full-text index over recipes, kept in sync by triggers. Built as an
+            # external-content table so the text itself is stored only once.
+            self.cursor.execute('''
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'recipes_fts'
+            ''')
+            fts_exists = self.cursor.fetchone() is not None
+
+            self.cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS recipes_fts USING fts5(
+                name, instructions,
+                content='recipes', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+            ''')
+
+            for trigger_sql in self._FTS_TRIGGER_SQL:
+                self.cursor.execute(trigger_sql)
+
+            # Index any recipes that existed before the FTS table was introduced
+            if not fts_exists:
+                self.cursor.execute("INSERT INTO recipes_fts(recipes_fts) VALUES ('rebuild')")
+
+            # Insert some default categories
+            default_categories = [
+                ('Breakfast',), ('Lunch',), ('Dinner',), ('Dessert',),
+                ('Appetizer',), ('Snack',), ('Soup',), ('Salad',),
+                ('Main Course',), ('Side Dish',), ('Beverage',), ('Baked Goods',)
+            ]
+
+            self.cursor.executemany(
+                'INSERT OR IGNORE INTO categories (name) VALUES (?)',
+                default_categories
+            )
+
+            # Refresh planner statistics so the new indexes actually get picked
+            self.cursor.execute('ANALYZE')
+
+            # Record that setup for this schema version has run; __init__ skips
+            # _create_tables entirely while the stored version is current
+            self.cursor.execute('PRAGMA user_version = %d' % self._SCHEMA_VERSION)
     
     def close(self):
-        """Close the database connection."""
+        """Close the writer and all pooled reader connections."""
         if self.conn:
+            # Refresh planner statistics for whatever churned this session,
+            # per the SQLite guidance for long-lived connections
+            try:
+                self.cursor.execute('PRAGMA optimize')
+            except sqlite3.Error:
+                pass
             self.conn.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+
+    def backup_to(self, path):
+        """Copy the live database to path with the online backup API.
+
+        Works against the open writer connection, so nothing needs to be
+        closed or reopened and concurrent readers keep working.
+        """
+        dest = sqlite3.connect(path)
+        try:
+            with dest:
+                self._writer.backup(dest)
+        finally:
+            dest.close()
+
+    def restore_from(self, path):
+        """Replace the live database contents from a backup file."""
+        source = sqlite3.connect(path)
+        try:
+            source.backup(self._writer)
+        finally:
+            source.close()
+        # Cached state may describe the old contents
+        self._cat_cache = None
     
     # Recipe CRUD operations
     def add_recipe(self, recipe_data):
@@ -127,186 +428,247 @@ class RecipeDatabase:
         name = recipe_data.get('name')
         instructions = recipe_data.get('instructions', '')
         favorite = 1 if recipe_data.get('favorite', False) else 0
-        
-        # Insert recipe into database
-        self.cursor.execute('''
-        INSERT INTO recipes (name, instructions, favorite)
-        VALUES (?, ?, ?)
-        ''', (name, instructions, favorite))
-        
-        # Get the ID of the newly inserted recipe
-        recipe_id = self.cursor.lastrowid
-        
-        # Add categories if provided
-        if 'categories' in recipe_data and recipe_data['categories']:
-            for category_name in recipe_data['categories']:
-                # Get or create category
-                self.cursor.execute('SELECT id FROM categories WHERE name = ?', (category_name,))
-                result = self.cursor.fetchone()
-                
-                if result:
-                    category_id = result[0]
-                else:
-                    self.cursor.execute('INSERT INTO categories (name) VALUES (?)', (category_name,))
-                    category_id = self.cursor.lastrowid
-                
-                # Link recipe to category
-                self.cursor.execute('''
-                INSERT OR IGNORE INTO recipe_categories (recipe_id, category_id)
-                VALUES (?, ?)
-                ''', (recipe_id, category_id))
-        
-        # Add ingredients if provided
-        if 'ingredients' in recipe_data and recipe_data['ingredients']:
-            for ingredient_text in recipe_data['ingredients']:
-                # Skip empty ingredients
-                if not ingredient_text.strip():
-                    continue
-                
-                # Add ingredient
-                self.cursor.execute('''
-                INSERT INTO recipe_ingredients (recipe_id, ingredient_text)
-                VALUES (?, ?)
-                ''', (recipe_id, ingredient_text.strip()))
-        
-        # Commit the transaction
-        self.conn.commit()
-        
-        return recipe_id
+
+        with self._transaction():
+            # Insert recipe into database
+            self.cursor.execute(self._INS_RECIPE_SQL,
+                                (name, instructions, favorite))
+
+            # Get the ID of the newly inserted recipe
+            recipe_id = self.cursor.lastrowid
+
+            # Add categories if provided
+            if 'categories' in recipe_data and recipe_data['categories']:
+                self._link_categories(recipe_id, recipe_data['categories'])
+
+            # Add ingredients if provided
+            if 'ingredients' in recipe_data and recipe_data['ingredients']:
+                self._insert_ingredients(recipe_id, recipe_data['ingredients'])
+
+            return recipe_id
+
+    def bulk_add_recipes(self, recipes):
+        """Add many recipes in one transaction, deferring FTS maintenance.
+
+        Drops the FTS sync triggers for the duration of the insert and
+        reindexes everything with a single rebuild afterwards, which is far
+        cheaper than maintaining the index row by row during a large import.
+        Returns the new recipe IDs in input order.
+        """
+        if not recipes:
+            return []
+
+        recipe_ids = []
+        with self._transaction():
+            self.cursor.execute('PRAGMA defer_foreign_keys = ON')
+            for trigger in ('recipes_ai', 'recipes_ad', 'recipes_au'):
+                self.cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+
+            for recipe_data in recipes:
+                self.cursor.execute(
+                    self._INS_RECIPE_SQL,
+                    (recipe_data.get('name'),
+                     recipe_data.get('instructions', ''),
+                     1 if recipe_data.get('favorite', False) else 0)
+                )
+
+                recipe_id = self.cursor.lastrowid
+                recipe_ids.append(recipe_id)
+
+                if recipe_data.get('categories'):
+                    self._link_categories(recipe_id, recipe_data['categories'])
+                if recipe_data.get('ingredients'):
+                    self._insert_ingredients(recipe_id, recipe_data['ingredients'])
+
+            for trigger_sql in self._FTS_TRIGGER_SQL:
+                self.cursor.execute(trigger_sql)
+            self.cursor.execute("INSERT INTO recipes_fts(recipes_fts) VALUES ('rebuild')")
+
+        return recipe_ids
+
+    def _resolve_category_ids(self, category_names):
+        """Upsert category names in one statement and return their IDs.
+
+        Must be called with the writer lock held.
+        """
+        self.cursor.execute(
+            self._UPSERT_CATEGORY_SQL,
+            (json.dumps(list(category_names)),)
+        )
+        category_ids = [row[0] for row in self.cursor.fetchall()]
+        self._cat_cache = None
+        return category_ids
+
+    def add_category(self, name):
+        """Create a category if it doesn't exist yet and return its ID."""
+        cache = self._cat_cache
+        with self._transaction():
+            category_id = self._resolve_category_ids([name])[0]
+        # _resolve_category_ids drops the cache wholesale; for a single
+        # known name it can be maintained in place instead
+        if cache is not None:
+            if name not in cache:
+                cache = sorted(cache + [name])
+            self._cat_cache = cache
+        return category_id
+
+    def _link_categories(self, recipe_id, category_names):
+        """Resolve category names to IDs in bulk and link them to a recipe.
+
+        Must be called with the writer lock held.
+        """
+        self.cursor.executemany(
+            self._INS_RECIPE_CAT_SQL,
+            [(recipe_id, category_id)
+             for category_id in self._resolve_category_ids(category_names)]
+        )
+
+    def _insert_ingredients(self, recipe_id, ingredients):
+        """Insert a recipe's ingredient rows in one batch, skipping blank lines.
+
+        Must be called with the writer lock held.
+        """
+        rows = [
+            (recipe_id, text.strip())
+            for text in ingredients
+            if text.strip()
+        ]
+        self.cursor.executemany(self._INS_RECIPE_ING_SQL, rows)
     
     def get_recipe(self, recipe_id):
         """Retrieve a recipe by its ID."""
-        # Get recipe basic information
-        self.cursor.execute('''
-        SELECT id, name, instructions, favorite, date_added
-        FROM recipes
-        WHERE id = ?
-        ''', (recipe_id,))
-        
-        recipe_row = self.cursor.fetchone()
-        
-        if not recipe_row:
+        # One round trip: ingredients and categories come back as JSON
+        # arrays assembled inside SQLite instead of two extra queries
+        with self._with_reader() as cursor:
+            cursor.execute(self._GET_RECIPE_SQL, (recipe_id,))
+            row = cursor.fetchone()
+
+        if not row:
             return None
-        
-        # Convert to dictionary
-        recipe = {
-            'id': recipe_row[0],
-            'name': recipe_row[1],
-            'instructions': recipe_row[2],
-            'favorite': bool(recipe_row[3]),
-            'date_added': recipe_row[4],
-            'ingredients': [],
-            'categories': []
+
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'instructions': row['instructions'],
+            'favorite': bool(row['favorite']),
+            'date_added': row['date_added'],
+            'ingredients': json.loads(row['ingredients']),
+            'categories': json.loads(row['categories'])
         }
-        
-        # Get ingredients
-        self.cursor.execute('''
-        SELECT ingredient_text
-        FROM recipe_ingredients
-        WHERE recipe_id = ?
-        ''', (recipe_id,))
-        
-        ingredients_rows = self.cursor.fetchall()
-        recipe['ingredients'] = [row[0] for row in ingredients_rows]
-        
-        # Get categories
-        self.cursor.execute('''
-        SELECT c.name
-        FROM recipe_categories rc
-        JOIN categories c ON rc.category_id = c.id
-        WHERE rc.recipe_id = ?
-        ''', (recipe_id,))
-        
-        categories_rows = self.cursor.fetchall()
-        recipe['categories'] = [row[0] for row in categories_rows]
-        
-        return recipe
-    
+
+    def get_recipes_bulk(self, recipe_ids):
+        """Retrieve multiple recipes by ID in a single query.
+
+        Returns the recipes in the order of recipe_ids; unknown IDs are
+        skipped, matching get_recipe returning None for them.
+        """
+        if not recipe_ids:
+            return []
+
+        with self._with_reader() as cursor:
+            cursor.execute(self._GET_RECIPES_BULK_SQL,
+                           (json.dumps(list(recipe_ids)),))
+            rows = cursor.fetchall()
+
+        by_id = {}
+        for row in rows:
+            by_id[row['id']] = {
+                'id': row['id'],
+                'name': row['name'],
+                'instructions': row['instructions'],
+                'favorite': bool(row['favorite']),
+                'date_added': row['date_added'],
+                'ingredients': json.loads(row['ingredients']),
+                'categories': json.loads(row['categories'])
+            }
+
+        return [by_id[rid] for rid in recipe_ids if rid in by_id]
+
     def update_recipe(self, recipe_id, recipe_data):
         """Update an existing recipe."""
-        # Check if recipe exists
-        self.cursor.execute('SELECT id FROM recipes WHERE id = ?', (recipe_id,))
-        if not self.cursor.fetchone():
-            return False
-        
-        # Update recipe basic information
-        self.cursor.execute('''
-        UPDATE recipes SET
-            name = ?,
-            instructions = ?,
-            favorite = ?
-        WHERE id = ?
-        ''', (
-            recipe_data.get('name'),
-            recipe_data.get('instructions', ''),
-            1 if recipe_data.get('favorite', False) else 0,
-            recipe_id
-        ))
-        
-        # Update categories (delete all and reinsert)
-        if 'categories' in recipe_data:
-            # Remove existing categories
-            self.cursor.execute('DELETE FROM recipe_categories WHERE recipe_id = ?', (recipe_id,))
-            
-            # Add new categories
-            for category_name in recipe_data['categories']:
-                # Get or create category
-                self.cursor.execute('SELECT id FROM categories WHERE name = ?', (category_name,))
-                result = self.cursor.fetchone()
-                
-                if result:
-                    category_id = result[0]
-                else:
-                    self.cursor.execute('INSERT INTO categories (name) VALUES (?)', (category_name,))
-                    category_id = self.cursor.lastrowid
-                
-                # Link recipe to category
-                self.cursor.execute('''
-                INSERT OR IGNORE INTO recipe_categories (recipe_id, category_id)
-                VALUES (?, ?)
-                ''', (recipe_id, category_id))
-        
-        # Update ingredients (delete all and reinsert)
-        if 'ingredients' in recipe_data:
-            # Remove existing ingredients
-            self.cursor.execute('DELETE FROM recipe_ingredients WHERE recipe_id = ?', (recipe_id,))
-            
-            # Add new ingredients
-            for ingredient_text in recipe_data['ingredients']:
-                # Skip empty ingredients
-                if not ingredient_text.strip():
-                    continue
-                
-                # Add ingredient
-                self.cursor.execute('''
-                INSERT INTO recipe_ingredients (recipe_id, ingredient_text)
-                VALUES (?, ?)
-                ''', (recipe_id, ingredient_text.strip()))
-        
-        # Commit the transaction
-        self.conn.commit()
-        
-        return True
+        with self._transaction():
+            # Update recipe basic information; the rowcount doubles as the
+            # existence check, saving a pre-SELECT per edit
+            self.cursor.execute(self._UPD_RECIPE_SQL, (
+                recipe_data.get('name'),
+                recipe_data.get('instructions', ''),
+                1 if recipe_data.get('favorite', False) else 0,
+                recipe_id
+            ))
+            if self.cursor.rowcount == 0:
+                return False
+
+            # Update categories: diff against the current links so an edit
+            # that didn't touch categories writes nothing
+            if 'categories' in recipe_data:
+                self.cursor.execute(
+                    'SELECT category_id FROM recipe_categories WHERE recipe_id = ?',
+                    (recipe_id,)
+                )
+                old_ids = {row[0] for row in self.cursor.fetchall()}
+                new_ids = set()
+                if recipe_data['categories']:
+                    new_ids = set(self._resolve_category_ids(recipe_data['categories']))
+
+                self.cursor.executemany(
+                    'DELETE FROM recipe_categories WHERE recipe_id = ? AND category_id = ?',
+                    [(recipe_id, category_id) for category_id in old_ids - new_ids]
+                )
+                self.cursor.executemany(
+                    self._INS_RECIPE_CAT_SQL,
+                    [(recipe_id, category_id) for category_id in new_ids - old_ids]
+                )
+
+            # Update ingredients the same way, diffing on the text itself
+            if 'ingredients' in recipe_data:
+                self.cursor.execute(
+                    'SELECT ingredient_text FROM recipe_ingredients WHERE recipe_id = ?',
+                    (recipe_id,)
+                )
+                old_texts = {row[0] for row in self.cursor.fetchall()}
+                new_texts = {
+                    text.strip() for text in recipe_data['ingredients'] if text.strip()
+                }
+
+                self.cursor.executemany(
+                    'DELETE FROM recipe_ingredients '
+                    'WHERE recipe_id = ? AND ingredient_text = ?',
+                    [(recipe_id, text) for text in old_texts - new_texts]
+                )
+                self.cursor.executemany(
+                    self._INS_RECIPE_ING_SQL,
+                    [(recipe_id, text) for text in new_texts - old_texts]
+                )
+
+            return True
+
     def delete_recipe(self, recipe_id):
         """Delete a recipe from the database."""
-        # Check if recipe exists
-        self.cursor.execute('SELECT id FROM recipes WHERE id = ?', (recipe_id,))
-        if not self.cursor.fetchone():
-            return False
-        
-        # Delete the recipe (foreign key constraints will handle related records)
-        self.cursor.execute('DELETE FROM recipes WHERE id = ?', (recipe_id,))
-        
-        # Commit the transaction
-        self.conn.commit()
-        
-        return True
+        with self._transaction():
+            # Delete the recipe (foreign key constraints will handle related
+            # records); the rowcount doubles as the existence check
+            self.cursor.execute('DELETE FROM recipes WHERE id = ?', (recipe_id,))
+
+            return self.cursor.rowcount > 0
     
+    @staticmethod
+    def _fts_match_expr(query):
+        """Turn raw user input into a safe FTS5 MATCH expression.
+
+        Each whitespace-separated term is double-quoted (so characters like
+        '-' are treated literally) and given a prefix star, e.g.
+        'choc chip' -> '"choc"* "chip"*'. Returns None for blank input.
+        """
+        terms = [term.replace('"', '""') for term in query.split()]
+        if not terms:
+            return None
+        return ' '.join(f'"{term}"*' for term in terms)
+
     def search_recipes(self, query=None, categories=None, favorite=None):
         """Search for recipes based on various criteria."""
         # Base query
         sql = '''
-        SELECT DISTINCT r.id, r.name, r.favorite
+        SELECT DISTINCT r.id, r.name, (r.favorite <> 0) AS favorite
         FROM recipes r
         '''
         
@@ -320,147 +682,115 @@ class RecipeDatabase:
             JOIN recipe_categories rc ON r.id = rc.recipe_id
             JOIN categories c ON rc.category_id = c.id
             '''
-            conditions.append('c.name IN ({})'.format(','.join(['?'] * len(categories))))
-            params.extend(categories)
-        
-        # Add text search condition - ONLY SEARCH RECIPE NAMES
-        if query:
-            conditions.append('r.name LIKE ?')
-            search_term = f'%{query}%'
-            params.append(search_term)
-        
+            # Bind the list as one JSON array so the SQL text (and therefore
+            # the cached prepared statement) is the same for any list length
+            conditions.append('c.name IN (SELECT value FROM json_each(?))')
+            params.append(json.dumps(list(categories)))
+        
+        # Add text search condition via the full-text index
+        match_expr = self._fts_match_expr(query) if query else None
+        if match_expr:
+            sql += '''
+            JOIN recipes_fts f ON f.rowid = r.id
+            '''
+            conditions.append('recipes_fts MATCH ?')
+            params.append(match_expr)
+
         # Add favorite condition
         if favorite:
             conditions.append('r.favorite = 1')
-        
+
         # Add WHERE clause if there are conditions
         if conditions:
             sql += ' WHERE ' + ' AND '.join(conditions)
-        
-        # Add ORDER BY
-        sql += ' ORDER BY r.name'
-        
-        # Execute the query
-        self.cursor.execute(sql, params)
-        
-        # Process results
-        recipes = []
-        recipe_ids = set()  # To avoid duplicates from joins
-        
-        for row in self.cursor.fetchall():
-            recipe_id = row[0]
-            if recipe_id not in recipe_ids:
-                recipe_ids.add(recipe_id)
-                recipe = {
-                    'id': recipe_id,
-                    'name': row[1],
-                    'favorite': bool(row[2])
-                }
-                recipes.append(recipe)
-        
-        return recipes
+
+        # Add ORDER BY (best match first when searching)
+        if match_expr:
+            sql += ' ORDER BY bm25(recipes_fts), r.name'
+        else:
+            sql += ' ORDER BY r.name'
+
+        # Execute the query; DISTINCT already dedupes join fan-out, and the
+        # Row factory lets dict() build each result without indexing
+        with self._with_reader() as cursor:
+            return [dict(row) for row in cursor.execute(sql, params)]
     
     def get_all_recipes(self):
         """Get all recipes in the database."""
-        self.cursor.execute('''
-        SELECT id, name, favorite
-        FROM recipes
-        ORDER BY name
-        ''')
-        
-        recipes = []
-        for row in self.cursor.fetchall():
-            recipe = {
-                'id': row[0],
-                'name': row[1],
-                'favorite': bool(row[2])
-            }
-            recipes.append(recipe)
-        
-        return recipes
-    
+        with self._with_reader() as cursor:
+            cursor.execute('''
+            SELECT id, name, (favorite <> 0) AS favorite
+            FROM recipes
+            ORDER BY name
+            ''')
+            return [dict(row) for row in cursor]
+
     def get_all_categories(self):
-        """Get all categories."""
-        self.cursor.execute('SELECT name FROM categories ORDER BY name')
-        return [row[0] for row in self.cursor.fetchall()]
+        """Get all categories (cached until a write adds a new one)."""
+        if self._cat_cache is None:
+            with self._with_reader() as cursor:
+                cursor.execute('SELECT name FROM categories ORDER BY name')
+                self._cat_cache = [row[0] for row in cursor.fetchall()]
+        return list(self._cat_cache)
     
     # Shopping list operations
     def create_shopping_list(self, name):
         """Create a new shopping list."""
-        self.cursor.execute('''
-        INSERT INTO shopping_lists (name)
-        VALUES (?)
-        ''', (name,))
-        
-        self.conn.commit()
-        return self.cursor.lastrowid
-    
+        with self._transaction():
+            self.cursor.execute('''
+            INSERT INTO shopping_lists (name)
+            VALUES (?)
+            ''', (name,))
+
+            return self.cursor.lastrowid
+
     def add_shopping_list_item(self, shopping_list_id, item_text):
         """Add an item to a shopping list."""
-        self.cursor.execute('''
-        INSERT INTO shopping_list_items (shopping_list_id, item_text)
-        VALUES (?, ?)
-        ''', (shopping_list_id, item_text))
-        
-        self.conn.commit()
-        return self.cursor.lastrowid
+        with self._transaction():
+            self.cursor.execute('''
+            INSERT INTO shopping_list_items (shopping_list_id, item_text)
+            VALUES (?, ?)
+            ''', (shopping_list_id, item_text))
+
+            return self.cursor.lastrowid
     
     def get_shopping_lists(self):
         """Get all shopping lists."""
-        self.cursor.execute('''
-        SELECT id, name, date_created
-        FROM shopping_lists
-        ORDER BY date_created DESC
-        ''')
-        
-        shopping_lists = []
-        for row in self.cursor.fetchall():
-            shopping_list = {
-                'id': row[0],
-                'name': row[1],
-                'date_created': row[2]
-            }
-            shopping_lists.append(shopping_list)
-        
-        return shopping_lists
-    
+        with self._with_reader() as cursor:
+            cursor.execute('''
+            SELECT id, name, date_created
+            FROM shopping_lists
+            ORDER BY date_created DESC
+            ''')
+            return [dict(row) for row in cursor]
+
     def get_shopping_list(self, shopping_list_id):
         """Get a shopping list by ID, including its items."""
-        # Get shopping list info
-        self.cursor.execute('''
-        SELECT id, name, date_created
-        FROM shopping_lists
-        WHERE id = ?
-        ''', (shopping_list_id,))
-        
-        row = self.cursor.fetchone()
-        if not row:
-            return None
-        
-        shopping_list = {
-            'id': row[0],
-            'name': row[1],
-            'date_created': row[2],
-            'items': []
-        }
-        
-        # Get shopping list items
-        self.cursor.execute('''
-        SELECT id, item_text, checked
-        FROM shopping_list_items
-        WHERE shopping_list_id = ?
-        ORDER BY id
-        ''', (shopping_list_id,))
-        
-        for row in self.cursor.fetchall():
-            item = {
-                'id': row[0],
-                'item_text': row[1],
-                'checked': bool(row[2])
-            }
-            shopping_list['items'].append(item)
-        
-        return shopping_list
+        with self._with_reader() as cursor:
+            # Get shopping list info
+            cursor.execute('''
+            SELECT id, name, date_created
+            FROM shopping_lists
+            WHERE id = ?
+            ''', (shopping_list_id,))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+
+            shopping_list = dict(row)
+
+            # Get shopping list items
+            cursor.execute('''
+            SELECT id, item_text, (checked <> 0) AS checked
+            FROM shopping_list_items
+            WHERE shopping_list_id = ?
+            ORDER BY id
+            ''', (shopping_list_id,))
+
+            shopping_list['items'] = [dict(item) for item in cursor]
+
+            return shopping_list
     
     def update_shopping_list_item(self, item_id, checked=None, item_text=None):
         """Update a shopping list item."""
@@ -482,25 +812,40 @@ class RecipeDatabase:
         
         # Add item ID to params
         params.append(item_id)
-        
+
         # Execute update
         sql = f"UPDATE shopping_list_items SET {', '.join(update_fields)} WHERE id = ?"
-        self.cursor.execute(sql, params)
-        
-        self.conn.commit()
-        return True
-    
+        with self._transaction():
+            self.cursor.execute(sql, params)
+
+            return True
+
+    def update_shopping_list_items_checked(self, updates):
+        """Set the checked state for many items in one transaction.
+
+        updates is an iterable of (item_id, checked) pairs.
+        """
+        rows = [(1 if checked else 0, item_id) for item_id, checked in updates]
+        if not rows:
+            return 0
+
+        with self._transaction():
+            self.cursor.executemany(
+                'UPDATE shopping_list_items SET checked = ? WHERE id = ?', rows
+            )
+            return len(rows)
+
     def delete_shopping_list_item(self, item_id):
         """Delete a shopping list item."""
-        self.cursor.execute('DELETE FROM shopping_list_items WHERE id = ?', (item_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
-    
+        with self._transaction():
+            self.cursor.execute('DELETE FROM shopping_list_items WHERE id = ?', (item_id,))
+            return self.cursor.rowcount > 0
+
     def delete_shopping_list(self, shopping_list_id):
         """Delete a shopping list."""
-        self.cursor.execute('DELETE FROM shopping_lists WHERE id = ?', (shopping_list_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._transaction():
+            self.cursor.execute('DELETE FROM shopping_lists WHERE id = ?', (shopping_list_id,))
+            return self.cursor.rowcount > 0
     
     def generate_shopping_list_from_recipes(self, recipe_ids, name=None):
         """Generate a shopping list from selected recipes."""
@@ -508,26 +853,27 @@ class RecipeDatabase:
         if not name:
             name = f"Shopping list ({datetime.date.today().strftime('%Y-%m-%d')})"
         
-        # Create a new shopping list
-        shopping_list_id = self.create_shopping_list(name)
-        
-        # If no recipes, return empty shopping list
-        if not recipe_ids:
+        # Create the list and copy the ingredients in one transaction; the
+        # INSERT...SELECT keeps the whole copy inside SQLite instead of
+        # round-tripping one insert per ingredient
+        with self._transaction():
+            self.cursor.execute('''
+            INSERT INTO shopping_lists (name)
+            VALUES (?)
+            ''', (name,))
+
+            shopping_list_id = self.cursor.lastrowid
+
+            if recipe_ids:
+                self.cursor.execute('''
+                INSERT INTO shopping_list_items (shopping_list_id, item_text)
+                SELECT ?, ingredient_text
+                FROM recipe_ingredients
+                WHERE recipe_id IN (SELECT value FROM json_each(?))
+                GROUP BY ingredient_text
+                ''', (shopping_list_id, json.dumps(list(recipe_ids))))
+
             return shopping_list_id
-        
-        # Get all ingredients from the selected recipes
-        placeholders = ','.join(['?'] * len(recipe_ids))
-        self.cursor.execute(f'''
-        SELECT ingredient_text
-        FROM recipe_ingredients
-        WHERE recipe_id IN ({placeholders})
-        ''', recipe_ids)
-        
-        # Add each ingredient as a shopping list item
-        for row in self.cursor.fetchall():
-            self.add_shopping_list_item(shopping_list_id, row[0])
-        
-        return shopping_list_id
     
     def export_recipe_to_json(self, recipe_id):
         """Export a recipe to JSON format."""
@@ -544,14 +890,9 @@ class RecipeDatabase:
             # Get all recipes if no IDs provided
             recipes = self.get_all_recipes()
             recipe_ids = [recipe['id'] for recipe in recipes]
-        
-        result = []
-        for recipe_id in recipe_ids:
-            recipe = self.export_recipe_to_json(recipe_id)
-            if recipe:
-                result.append(recipe)
-        
-        return result
+
+        # One batched query instead of one get_recipe round trip per id
+        return self.get_recipes_bulk(recipe_ids)
 
     def import_recipe_from_json(self, recipe_data):
         """Import a recipe from JSON data."""
@@ -561,16 +902,27 @@ class RecipeDatabase:
         
         # Extract recipe ID if present (for update vs. insert)
         recipe_id = recipe_data.get('id')
-        
-        # Check if recipe already exists
-        if recipe_id:
-            self.cursor.execute('SELECT id FROM recipes WHERE id = ?', (recipe_id,))
-            if self.cursor.fetchone():
-                # Update existing recipe
-                return self.update_recipe(recipe_id, recipe_data)
-        
-        # Insert new recipe
-        return self.add_recipe(recipe_data)
+
+        # Check existence on the writer so a surrounding bulk transaction
+        # sees recipes imported earlier in the same batch
+        with self._transaction():
+            if recipe_id:
+                self.cursor.execute('SELECT id FROM recipes WHERE id = ?', (recipe_id,))
+                if self.cursor.fetchone():
+                    # Update existing recipe
+                    return self.update_recipe(recipe_id, recipe_data)
+
+            # Insert new recipe
+            return self.add_recipe(recipe_data)
+
+    def import_recipes_from_json(self, recipes):
+        """Import many recipe dicts in one transaction; returns the count."""
+        imported = 0
+        with self._transaction():
+            for recipe_data in recipes:
+                if self.import_recipe_from_json(recipe_data):
+                    imported += 1
+        return imported
 
     def export_shopping_list_to_json(self, shopping_list_id):
         """Export a shopping list to JSON format."""
@@ -604,26 +956,46 @@ class RecipeDatabase:
         
         # Extract shopping list ID if present (for update vs. insert)
         shopping_list_id = shopping_list_data.get('id')
-        
-        # Create new shopping list
-        if not shopping_list_id or not self.get_shopping_list(shopping_list_id):
-            shopping_list_id = self.create_shopping_list(shopping_list_data['name'])
-        
-        # Add items if present
-        if 'items' in shopping_list_data and shopping_list_data['items']:
-            for item in shopping_list_data['items']:
-                # Skip if the item doesn't have text
-                if 'item_text' not in item:
-                    continue
-                
-                item_id = self.add_shopping_list_item(shopping_list_id, item['item_text'])
-                
-                # Update checked status if present
-                if 'checked' in item and item_id:
-                    self.update_shopping_list_item(item_id, checked=item['checked'])
-        
+
+        # One transaction for the list row and all of its items
+        with self._transaction():
+            if not shopping_list_id or not self._shopping_list_exists(shopping_list_id):
+                shopping_list_id = self.create_shopping_list(shopping_list_data['name'])
+
+            # Insert the items in one batch, checked state included
+            rows = [
+                (shopping_list_id, item['item_text'],
+                 1 if item.get('checked') else 0)
+                for item in shopping_list_data.get('items') or []
+                if 'item_text' in item
+            ]
+            self.cursor.executemany(
+                'INSERT INTO shopping_list_items '
+                '(shopping_list_id, item_text, checked) VALUES (?, ?, ?)',
+                rows
+            )
+
         return shopping_list_id
-    
+
+    def _shopping_list_exists(self, shopping_list_id):
+        """Check list existence on the writer (sees uncommitted batch work).
+
+        Must be called with the writer lock held.
+        """
+        self.cursor.execute('SELECT 1 FROM shopping_lists WHERE id = ?',
+                            (shopping_list_id,))
+        return self.cursor.fetchone() is not None
+
+    def import_shopping_lists_from_json(self, shopping_lists):
+        """Import many shopping-list dicts in one transaction."""
+        imported = 0
+        with self._transaction():
+            for list_data in shopping_lists:
+                if self.import_shopping_list_from_json(list_data):
+                    imported += 1
+        return imported
+
+
 class RecipeApp:
     """
     Main application class for the Recipe Organization System.
@@ -639,19 +1011,59 @@ class RecipeApp:
         
         # Initialize database
         self.db = RecipeDatabase()
-        
-        # Create main container
-        self.main_frame = ctk.CTkFrame(self.root)
-        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Pending after() callback for the debounced recipe search, plus the
+        # last search's key and rows so filter toggles can skip the DB
+        self._search_after_id = None
+        self._last_search_key = None
+        self._last_search_rows = None
+
+        # Recipe and shopping list currently shown in their detail views;
+        # None while the respective welcome panel is up
+        self.current_recipe_id = None
+        self.current_shopping_list_id = None
+
+        # Which panel occupies the detail pane ("welcome", "detail" or
+        # "form"); lets the show/hide helpers skip redundant pack calls
+        self._detail_pane_mode = "welcome"
+
+        # Pending post-save refresh, coalesced into one idle callback
+        self._refresh_pending = False
+        self._post_save_recipe_id = None
+
+        # Bumped each time the recipe form opens; a stale chunked
+        # instructions fill sees the mismatch and stops re-arming
+        self._instr_fill_gen = 0
+
+        # Queued shopping-item checkbox toggles, flushed in one batch so
+        # rapid clicking costs one transaction instead of one per click
+        self._pending_check_updates = {}
+        self._check_flush_job = None
+
+        # Create main container
+        self.main_frame = ctk.CTkFrame(self.root)
+        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+    # Class-level flag: ttk styles are process-wide, so they only need to
+    # be configured once no matter how many windows get built
+    _theme_done = False
 
     def setup_theme(self):
         """Set up the application theme and styling."""
-        # Custom styling is handled by CustomTkinter through themes
-        # Most styling is now applied directly to widgets
-        pass
-    
+        # Custom styling is handled by CustomTkinter through themes; the
+        # recipe Treeview is plain ttk and gets its look set here, once
+        if RecipeApp._theme_done:
+            return
+        RecipeApp._theme_done = True
+
+        style = ttk.Style()
+        style.configure("Treeview", font=("Arial", 13), rowheight=28)
+
     def create_widgets(self):
         """Create all the widgets for the application."""
+        # Apply styling before any ttk widget exists
+        self.setup_theme()
+
         # Create notebook for tabs
         self.notebook = ctk.CTkTabview(self.main_frame)
         self.notebook.pack(fill="both", expand=True)
@@ -774,111 +1186,72 @@ class RecipeApp:
         )
         add_recipe_btn.pack(fill="x", padx=10, pady=10)
         
-        # Create scrollable frame for recipe list - replacing Canvas + Scrollbar setup
-        self.recipe_list_scrollable = ctk.CTkScrollableFrame(
-            self.recipe_list_frame,
-            label_text="Available Recipes"
-        )
-        self.recipe_list_scrollable.pack(fill="both", expand=True, padx=10, pady=10)
-        
+        # Single Treeview instead of a frame-per-recipe scrollable list: one
+        # widget renders everything as drawn text, so reloading the list no
+        # longer creates and destroys a stack of widgets per recipe
+        tree_frame = tk.Frame(self.recipe_list_frame)
+        tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        self.recipe_tree = ttk.Treeview(tree_frame, show="tree", selectmode="browse")
+        self.recipe_tree.tag_configure("favorite", font=("Arial", 14, "bold"))
+
+        tree_scrollbar = ctk.CTkScrollbar(tree_frame, command=self.recipe_tree.yview)
+        self.recipe_tree.configure(yscrollcommand=tree_scrollbar.set)
+
+        tree_scrollbar.pack(side="right", fill="y")
+        self.recipe_tree.pack(side="left", fill="both", expand=True)
+
+        self.recipe_tree.bind("<<TreeviewSelect>>", self.on_recipe_select)
+
         # Load recipes
         self.load_recipe_list()
-    
-    def on_recipe_list_configure(self, event):
-        """Handle recipe list inner frame configuration."""
-        # Update the scrollregion to encompass the inner frame
-        self.recipe_canvas.configure(scrollregion=self.recipe_canvas.bbox(tk.ALL))
-    
-    def on_recipe_canvas_configure(self, event):
-        """Handle recipe canvas configuration."""
-        # Update the width of the inner frame to fill the canvas
-        self.recipe_canvas.itemconfig(self.recipe_canvas_window, width=event.width)
+
+    def on_recipe_select(self, event=None):
+        """Load the detail view for the recipe selected in the tree."""
+        selection = self.recipe_tree.selection()
+        if selection and selection[0].isdigit():
+            self.load_recipe_detail(int(selection[0]))
 
     def load_recipe_list(self, recipes=None):
         """Load recipes into the recipe list."""
         # Clear existing items
-        for widget in self.recipe_list_scrollable.winfo_children():
-            widget.destroy()
-        
-        # If no recipes passed, get all recipes
+        self.recipe_tree.delete(*self.recipe_tree.get_children())
+
+        # If no recipes passed, get all recipes. Callers hit this path after
+        # add/edit/delete, so the cached search results are stale - drop them
         if recipes is None:
+            self._last_search_key = None
+            self._last_search_rows = None
             search_term = self.search_var.get() if hasattr(self, 'search_var') else ""
             category = self.category_var.get() if hasattr(self, 'category_var') and self.category_var.get() != "All" else None
             favorite = self.favorite_var.get() if hasattr(self, 'favorite_var') and self.favorite_var.get() else None
             categories = [category] if category else None
             recipes = self.db.search_recipes(search_term, categories, favorite)
-        
+
         if not recipes:
-            # Show no recipes message - REPLACE ttk WITH ctk HERE
-            no_recipes = ctk.CTkLabel(
-                self.recipe_list_scrollable, 
-                text="No recipes found",
-                font=("Arial", 12)
-            )
-            no_recipes.pack(fill="x", padx=10, pady=10)
+            # Placeholder row; the digit-iid check in on_recipe_select
+            # keeps it from being treated as a recipe
+            self.recipe_tree.insert("", "end", iid="no-results", text="No recipes found")
         else:
-            # Add recipe items
+            # One text row per recipe, keyed by recipe ID
             for recipe in recipes:
-                self.create_recipe_list_item(recipe)
-    
-    # In the create_recipe_list_item method, add a tag to identify selected recipes:
-    def create_recipe_list_item(self, recipe):
-        # Create frame for recipe item with modern styling
-        recipe_frame = ctk.CTkFrame(self.recipe_list_scrollable)
-        recipe_frame.pack(fill="x", padx=5, pady=5)
-        
-        # Store the recipe ID in the frame for later reference
-        recipe_frame.recipe_id = recipe["id"]
-        
-        # Use a lambda to bind click event to the whole frame
-        recipe_frame.bind("<Button-1>", lambda e, r=recipe: self.select_recipe(r["id"], recipe_frame))
-        
-        # Create recipe item content with modern styling
-        name_font = ("Arial", 14, "bold") if recipe["favorite"] else ("Arial", 14)
-        
-        name_label = ctk.CTkLabel(
-            recipe_frame, 
-            text=recipe["name"],
-            font=name_font
-        )
-        name_label.pack(fill="x", padx=10, pady=5)
-        name_label.bind("<Button-1>", lambda e, r=recipe: self.select_recipe(r["id"], recipe_frame))
-        
-        # Add favorite star if recipe is favorite
-        if recipe["favorite"]:
-            star_label = ctk.CTkLabel(
-                recipe_frame,
-                text="★",
-                font=("Arial", 14),
-                text_color=("gold", "gold")  # Same color for light/dark mode
-            )
-            star_label.place(relx=0.95, rely=0.5, anchor="e")
-        
-        # Add separator (thin frame instead of ttk.Separator)
-        separator = ctk.CTkFrame(self.recipe_list_scrollable, height=1, fg_color=("gray80", "gray30"))
-        separator.pack(fill="x", padx=10, pady=2)
-    
-    def select_recipe(self, recipe_id, selected_frame):
-        """Handle recipe selection and highlighting."""
-        # Load the recipe detail
-        self.load_recipe_detail(recipe_id)
-        
-        # Remove highlight from all recipe frames
-        for child in self.recipe_list_scrollable.winfo_children():
-            if isinstance(child, ctk.CTkFrame) and hasattr(child, 'recipe_id'):
-                child.configure(fg_color=("gray90", "gray20"))  # Reset to default color
-        
-        # Highlight the selected frame
-        selected_frame.configure(fg_color=("lightblue", "navy"))  # Highlight color
+                name = f"★ {recipe['name']}" if recipe["favorite"] else recipe["name"]
+                self.recipe_tree.insert(
+                    "", "end",
+                    iid=str(recipe["id"]),
+                    text=name,
+                    tags=("favorite",) if recipe["favorite"] else ()
+                )
 
     def setup_recipe_detail(self):
         """Set up the recipe detail part of the recipes tab."""
-        # Create a frame for recipe editing form
-        self.recipe_form_frame = ctk.CTkFrame(self.recipe_detail_frame)
-        self.recipe_form_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Initially hide the form
-        self.recipe_form_frame.pack_forget()
+        # Persistent scrollable container for the recipe form; opening a
+        # form clears and repopulates it rather than rebuilding the
+        # container (and its scroll plumbing) from scratch every time
+        self.recipe_form_frame = ctk.CTkScrollableFrame(
+            self.recipe_detail_frame,
+            label_text="Recipe Form"
+        )
         
         # Create scrollable frame for recipe details
         self.recipe_view_frame = ctk.CTkScrollableFrame(
@@ -886,244 +1259,384 @@ class RecipeApp:
             label_text="Recipe Details"
         )
         self.recipe_view_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Initially show a welcome message in detail view
+
+        # Persistent welcome panel; shown whenever no recipe is selected
+        self.welcome_frame = ctk.CTkFrame(self.recipe_view_frame)
         welcome_label = ctk.CTkLabel(
-            self.recipe_view_frame, 
+            self.welcome_frame,
             text="Welcome to Recipe Organization System",
             font=("Arial", 20, "bold")
         )
         welcome_label.pack(pady=20)
-        
+
         instruction_label = ctk.CTkLabel(
-            self.recipe_view_frame,
+            self.welcome_frame,
             text="Select a recipe from the list on the left or create a new recipe.",
             font=("Arial", 14)
         )
         instruction_label.pack(pady=10)
+        self.welcome_frame.pack(fill="both", expand=True)
+
+        # Build the reusable detail widgets once; selections only update them
+        self._build_recipe_view_skeleton()
+
+    def _build_recipe_view_skeleton(self):
+        """Build the recipe detail widgets once; loads only update them.
+
+        Widget creation is the expensive part of Tk, so the detail view is
+        a fixed skeleton whose labels get reconfigured per selection;
+        optional sections are toggled with pack/pack_forget.
+        """
+        self.recipe_detail_view = ctk.CTkFrame(self.recipe_view_frame)
+
+        # Recipe header (for buttons)
+        header_frame = ctk.CTkFrame(self.recipe_detail_view)
+        header_frame.pack(fill="x", padx=10, pady=10)
+
+        # Title frame for recipe name
+        title_frame = ctk.CTkFrame(self.recipe_detail_view)
+        title_frame.pack(fill="x", padx=10, pady=(0, 5))
+
+        self.detail_title_label = ctk.CTkLabel(
+            title_frame,
+            text="",
+            font=("Arial", 20, "bold")
+        )
+        self.detail_title_label.pack(side="left", pady=5)
+
+        # Star shown only while the displayed recipe is a favorite
+        self.detail_favorite_label = ctk.CTkLabel(
+            title_frame,
+            text="★",
+            font=("Arial", 18),
+            text_color=("gold", "gold")
+        )
+
+        # Buttons act on whichever recipe is currently displayed
+        btn_frame = ctk.CTkFrame(header_frame)
+        btn_frame.pack(fill="x")
+
+        edit_btn = ctk.CTkButton(
+            btn_frame,
+            text="Edit",
+            command=lambda: self.edit_recipe(self.current_recipe_id)
+        )
+        edit_btn.pack(side="left", padx=5, pady=5, expand=True, fill="x")
+
+        delete_btn = ctk.CTkButton(
+            btn_frame,
+            text="Delete",
+            command=lambda: self.delete_recipe(self.current_recipe_id)
+        )
+        delete_btn.pack(side="left", padx=5, pady=5, expand=True, fill="x")
+
+        add_to_shopping_btn = ctk.CTkButton(
+            btn_frame,
+            text="Add to Shopping List",
+            command=lambda: self.add_recipe_to_shopping_list(self.current_recipe_id)
+        )
+        add_to_shopping_btn.pack(side="left", padx=5, pady=5, expand=True, fill="x")
+
+        # Categories row; packed before the separator when non-empty
+        self.detail_cat_frame = ctk.CTkFrame(self.recipe_detail_view)
+        self.detail_cat_label = ctk.CTkLabel(
+            self.detail_cat_frame,
+            text="",
+            font=("Arial", 12)
+        )
+        self.detail_cat_label.pack(anchor="w")
+
+        # Separator
+        self.detail_separator = ctk.CTkFrame(
+            self.recipe_detail_view, height=1, fg_color=("gray80", "gray30")
+        )
+        self.detail_separator.pack(fill="x", padx=10, pady=10)
+
+        # Ingredients section; one multiline label holds the whole block
+        self.detail_ing_frame = ctk.CTkFrame(self.recipe_detail_view)
+        ing_title = ctk.CTkLabel(
+            self.detail_ing_frame, text="Ingredients", font=("Arial", 16, "bold")
+        )
+        ing_title.pack(anchor="w", padx=10, pady=5)
+        self.detail_ing_label = ctk.CTkLabel(
+            self.detail_ing_frame,
+            text="",
+            anchor="w",
+            justify="left"
+        )
+        self.detail_ing_label.pack(fill="x", padx=10, pady=2)
+
+        # Instructions section
+        self.detail_instr_frame = ctk.CTkFrame(self.recipe_detail_view)
+        instr_title = ctk.CTkLabel(
+            self.detail_instr_frame, text="Instructions", font=("Arial", 16, "bold")
+        )
+        instr_title.pack(anchor="w", padx=10, pady=5)
+        self.detail_instr_label = ctk.CTkLabel(
+            self.detail_instr_frame,
+            text="",
+            wraplength=600,
+            justify="left"
+        )
+        self.detail_instr_label.pack(fill="x", padx=10, pady=5)
+
+        # Zero-height anchor so optional sections can re-pack in order
+        self.detail_bottom_anchor = ctk.CTkFrame(self.recipe_detail_view, height=0)
+        self.detail_bottom_anchor.pack(fill="x")
+
+    def _show_welcome_panel(self):
+        """Show the welcome panel in place of the recipe detail view."""
+        if self._detail_pane_mode == "welcome":
+            return
+        self.recipe_detail_view.pack_forget()
+        self.welcome_frame.pack(fill="both", expand=True)
+        self._detail_pane_mode = "welcome"
     
     def search_recipes(self, *args):
-        """Handle recipe search and filtering."""
+        """Schedule a debounced search so each keystroke doesn't hit the DB."""
+        # Coalesce bursts of trace callbacks (typing, toggling filters) into
+        # one query that runs once input has been idle for 200 ms
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(200, self._run_recipe_search)
+
+    def _run_recipe_search(self):
+        """Run the actual recipe search and refresh the list."""
+        self._search_after_id = None
+
         # Get search parameters
         search_term = self.search_var.get() if hasattr(self, 'search_var') else ""
         category = self.category_var.get() if hasattr(self, 'category_var') and self.category_var.get() != "All" else None
         favorite = self.favorite_var.get() if hasattr(self, 'favorite_var') else None
-        
-        # Prepare filter parameters
-        categories = [category] if category else None
-        
-        # Search for recipes
-        recipes = self.db.search_recipes(search_term, categories, favorite)
-        
-        # Update the recipe list with the search results
-        self.load_recipe_list(recipes)
 
-    def load_recipe_list(self, recipes=None):
-        """Load recipes into the recipe list."""
-        # Clear existing items
-        for widget in self.recipe_list_scrollable.winfo_children():
-            widget.destroy()
-        
-        # If no recipes passed, get all recipes
-        if recipes is None:
-            search_term = self.search_var.get() if hasattr(self, 'search_var') else ""
-            category = self.category_var.get() if hasattr(self, 'category_var') and self.category_var.get() != "All" else None
-            favorite = self.favorite_var.get() if hasattr(self, 'favorite_var') and self.favorite_var.get() else None
-            categories = [category] if category else None
-            recipes = self.db.search_recipes(search_term, categories, favorite)
-        
-        if not recipes:
-            # Show no recipes message
-            no_recipes = ctk.CTkLabel(
-                self.recipe_list_scrollable, 
-                text="No recipes found",
-                font=("Arial", 12)
-            )
-            no_recipes.pack(fill="x", padx=10, pady=10)
+        # Reuse the last result set when only the favorites toggle changed;
+        # the flag is part of each cached row, so no SQL is needed for it
+        key = (search_term, category)
+        if key == self._last_search_key:
+            recipes = self._last_search_rows
         else:
-            # Add recipe items
-            for recipe in recipes:
-                self.create_recipe_list_item(recipe)
+            categories = [category] if category else None
+            recipes = self.db.search_recipes(search_term, categories, None)
+            self._last_search_key = key
+            self._last_search_rows = recipes
+
+        if favorite:
+            recipes = [r for r in recipes if r["favorite"]]
+
+        # Update the recipe list with the search results
+        self.load_recipe_list(recipes)
 
     def new_recipe(self):
         """Create a new recipe."""
-        # Clear the recipe detail view
-        for widget in self.recipe_view_frame.winfo_children():
-            widget.destroy()
-        
-        # Hide recipe view and show recipe form
-        self.recipe_view_frame.pack_forget()
-        
-        # Clear form frame and recreate as scrollable frame
-        for widget in self.recipe_form_frame.winfo_children():
-            widget.destroy()
-        
-        self.recipe_form_frame = ctk.CTkScrollableFrame(
-            self.recipe_detail_frame,
-            label_text="New Recipe"
-        )
-        self.recipe_form_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # IMPORTANT: Reset the ingredients list to empty
-        self.ingredients = []
+        self._open_recipe_form(None)
 
-        # Create form header with large title
-        heading = ctk.CTkLabel(
-            self.recipe_form_frame, 
-            text="New Recipe", 
+    def _ensure_recipe_form(self):
+        """Build the recipe form widgets once; later opens only repopulate.
+
+        The form skeleton (30+ widgets) is identical for new and edited
+        recipes, so it is constructed lazily on first use and kept for the
+        lifetime of the window.
+        """
+        if getattr(self, '_form_built', False):
+            return
+        self._form_built = True
+
+        # Form header with large title
+        self.form_heading = ctk.CTkLabel(
+            self.recipe_form_frame,
+            text="",
             font=("Arial", 20, "bold")
         )
-        heading.pack(pady=10)
-        
+        self.form_heading.pack(pady=10)
+
         # Basic info section
         basic_frame = ctk.CTkFrame(self.recipe_form_frame)
         basic_frame.pack(fill="x", padx=10, pady=5)
-        
+
         basic_label = ctk.CTkLabel(basic_frame, text="Basic Information", font=("Arial", 14, "bold"))
         basic_label.pack(anchor="w", padx=5, pady=5)
-        
+
         # Name field
         name_frame = ctk.CTkFrame(basic_frame)
         name_frame.pack(fill="x", padx=5, pady=5)
-        
+
         name_label = ctk.CTkLabel(name_frame, text="Recipe Name:")
         name_label.pack(side="left", padx=5)
-        
-        self.recipe_name_var = ctk.StringVar()
-        name_entry = ctk.CTkEntry(name_frame, textvariable=self.recipe_name_var, width=300)
-        name_entry.pack(side="left", padx=5)
-        
+
+        # Plain entry read once at save time; a StringVar would register a
+        # Tcl variable and trace machinery nothing ever listens to
+        self.recipe_name_entry = ctk.CTkEntry(name_frame, width=300)
+        self.recipe_name_entry.pack(side="left", padx=5)
+
         # Favorite checkbox
         self.recipe_favorite_var = ctk.BooleanVar()
         favorite_check = ctk.CTkCheckBox(name_frame, text="Favorite", variable=self.recipe_favorite_var)
         favorite_check.pack(side="left", padx=5)
-        
+
         # Categories section
         cat_frame = ctk.CTkFrame(self.recipe_form_frame)
         cat_frame.pack(fill="x", padx=10, pady=10)
-        
+
         cat_label = ctk.CTkLabel(cat_frame, text="Categories", font=("Arial", 14, "bold"))
         cat_label.pack(anchor="w", padx=5, pady=5)
-        
-        # Replace the tk.Listbox with a scrollable frame containing checkboxes
+
+        # Scrollable frame of checkboxes; rows are added as categories appear
         self.categories_scrollable = ctk.CTkScrollableFrame(cat_frame, height=150)
         self.categories_scrollable.pack(fill="x", padx=5, pady=5)
-        
-        # Get all categories
-        all_categories = self.db.get_all_categories()
-        
+
         # Dictionary to store category checkbox variables
         self.category_vars = {}
-        
-        # Create a checkbox for each category
-        for category in all_categories:
-            var = ctk.BooleanVar(value=False)
-            self.category_vars[category] = var
-            checkbox = ctk.CTkCheckBox(self.categories_scrollable, text=category, variable=var)
-            checkbox.pack(anchor="w", padx=5, pady=2)
-        
+
         # Frame for the new category button
         cat_btn_frame = ctk.CTkFrame(cat_frame)
         cat_btn_frame.pack(fill="x", padx=5, pady=5)
-        
+
         # New category button
         new_cat_btn = ctk.CTkButton(
-            cat_btn_frame, 
-            text="New Category", 
+            cat_btn_frame,
+            text="New Category",
             command=self.add_new_category
         )
         new_cat_btn.pack(side="left", padx=5)
-        
+
         # Ingredients section
         ingredients_frame = ctk.CTkFrame(self.recipe_form_frame)
         ingredients_frame.pack(fill="x", padx=10, pady=10)
-        
+
         ing_label = ctk.CTkLabel(ingredients_frame, text="Ingredients", font=("Arial", 14, "bold"))
         ing_label.pack(anchor="w", padx=5, pady=5)
-        
+
         # Ingredients list
         self.ingredients_list_frame = ctk.CTkFrame(ingredients_frame)
         self.ingredients_list_frame.pack(fill="x", padx=5, pady=5)
-        
-        # Ingredient list will be populated here
-        self.ingredients = []  # Store ingredient data
-        
+
+        # Ingredient rows keyed by entry id for O(1) removal
+        self.ingredients = {}
+
         # Add ingredient button
         add_ing_btn = ctk.CTkButton(
-            ingredients_frame, 
-            text="Add Ingredient", 
+            ingredients_frame,
+            text="Add Ingredient",
             command=self.add_ingredient_row
         )
         add_ing_btn.pack(padx=5, pady=5)
-        
+
         # Instructions section
         instr_frame = ctk.CTkFrame(self.recipe_form_frame)
         instr_frame.pack(fill="x", padx=10, pady=10)
-        
+
         instr_label = ctk.CTkLabel(instr_frame, text="Instructions", font=("Arial", 14, "bold"))
         instr_label.pack(anchor="w", padx=5, pady=5)
-        
+
         self.instructions_text = ctk.CTkTextbox(instr_frame, height=150, wrap="word")
         self.instructions_text.pack(fill="x", padx=5, pady=5)
-        
+
         # Button frame
         btn_frame = ctk.CTkFrame(self.recipe_form_frame)
         btn_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Save button
-        save_btn = ctk.CTkButton(
-            btn_frame, 
-            text="Save Recipe", 
-            command=self.save_new_recipe
-        )
-        save_btn.pack(side="left", padx=5)
-        
+
+        # Save button; text and command are set per open
+        self.form_save_btn = ctk.CTkButton(btn_frame, text="Save Recipe")
+        self.form_save_btn.pack(side="left", padx=5)
+
         # Cancel button
         cancel_btn = ctk.CTkButton(
-            btn_frame, 
-            text="Cancel", 
+            btn_frame,
+            text="Cancel",
             command=self.cancel_recipe_edit
         )
         cancel_btn.pack(side="left", padx=5)
-        
-        # Add a single ingredient row to start
-        self.add_ingredient_row()
-    
+
+    def _refresh_form_categories(self, selected):
+        """Sync the category checkboxes with the database and a selection."""
+        selected = set(selected)
+        for category in self.db.get_all_categories():
+            if category not in self.category_vars:
+                var = ctk.BooleanVar()
+                self.category_vars[category] = var
+                checkbox = ctk.CTkCheckBox(self.categories_scrollable, text=category, variable=var)
+                checkbox.pack(anchor="w", padx=5, pady=2)
+        for category, var in self.category_vars.items():
+            var.set(category in selected)
+
+    def _clear_ingredient_rows(self):
+        """Remove every ingredient row from the form."""
+        for widget in self.ingredients_list_frame.winfo_children():
+            widget.destroy()
+        self.ingredients = {}
+
+    def _open_recipe_form(self, recipe):
+        """Show the recipe form, populated for editing or blank for a new one."""
+        # Hide recipe view and show the persistent form container
+        self.recipe_view_frame.pack_forget()
+        self._detail_pane_mode = "form"
+        self._ensure_recipe_form()
+
+        title = f"Edit Recipe: {recipe['name']}" if recipe else "New Recipe"
+        self.recipe_form_frame.configure(label_text=title)
+        self.form_heading.configure(text=title)
+        self.recipe_form_frame.pack(fill="both", expand=True, padx=5, pady=5)
+
+        # Reset the field contents left over from the previous open; bumping
+        # the generation stops any chunked fill still running for them
+        self._instr_fill_gen += 1
+        self.recipe_name_entry.delete(0, "end")
+        self.instructions_text.delete("1.0", "end")
+        self._clear_ingredient_rows()
+
+        if recipe:
+            self.recipe_name_entry.insert(0, recipe["name"])
+            self.recipe_favorite_var.set(recipe["favorite"])
+            self._refresh_form_categories(recipe["categories"])
+            for ingredient_text in recipe["ingredients"]:
+                self.add_ingredient_row_with_text(ingredient_text)
+            # Paint long instructions after the form is already interactive
+            gen = self._instr_fill_gen
+            self.root.after_idle(
+                lambda: self._chunked_insert(
+                    self.instructions_text, recipe["instructions"], gen
+                )
+            )
+            self.form_save_btn.configure(
+                text="Save Changes",
+                command=lambda: self.save_recipe_changes(recipe["id"])
+            )
+        else:
+            self.recipe_favorite_var.set(False)
+            self._refresh_form_categories(())
+            # Add a single ingredient row to start
+            self.add_ingredient_row()
+            self.form_save_btn.configure(text="Save Recipe", command=self.save_new_recipe)
+
     def add_ingredient_row(self):
         """Add a new ingredient row to the form."""
         row_frame = ctk.CTkFrame(self.ingredients_list_frame)
         row_frame.pack(fill="x", padx=5, pady=2)
         
-        # Ingredient text field
-        ingredient_var = ctk.StringVar()
-        ingredient_entry = ctk.CTkEntry(row_frame, textvariable=ingredient_var, width=300)
+        # Ingredient text field; the entry widget itself is stored and read
+        # at save time, avoiding a Tcl variable per row
+        ingredient_entry = ctk.CTkEntry(row_frame, width=300)
         ingredient_entry.pack(side="left", padx=2, fill="x", expand=True)
-        
-        # Remove button
+
+        # Remove button; the closure owns the frame, so the list only needs
+        # to hold the entry itself rather than a dict per row
         def remove_ingredient():
             row_frame.destroy()
-            self.ingredients.remove(ingredient_data)
-        
+            self.ingredients.pop(id(ingredient_entry), None)
+
         remove_btn = ctk.CTkButton(row_frame, text="X", width=30, command=remove_ingredient)
         remove_btn.pack(side="left", padx=2)
-        
-        # Store the ingredient data
-        ingredient_data = {
-            "row_frame": row_frame,
-            "ingredient_var": ingredient_var
-        }
-        
-        self.ingredients.append(ingredient_data)
-        
-        return ingredient_data
+
+        self.ingredients[id(ingredient_entry)] = ingredient_entry
+
+        return ingredient_entry
         
     def add_new_category(self):
         """Add a new category to the database."""
         new_category = simpledialog.askstring("New Category", "Enter new category name:")
         if new_category and new_category.strip():
             # Add to database
-            self.db.cursor.execute('INSERT OR IGNORE INTO categories (name) VALUES (?)', (new_category,))
-            self.db.conn.commit()
+            self.db.add_category(new_category)
             
             # Add to UI as a checkbox
             var = ctk.BooleanVar(value=True)
@@ -1134,73 +1647,66 @@ class RecipeApp:
     def save_new_recipe(self):
         """Save a new recipe to the database."""
         # Validate required fields
-        if not self.recipe_name_var.get().strip():
+        if not self.recipe_name_entry.get().strip():
             messagebox.showerror("Error", "Recipe name is required")
             return
         
         # Gather recipe data
         recipe_data = {
-            "name": self.recipe_name_var.get().strip(),
+            "name": self.recipe_name_entry.get().strip(),
             "instructions": self.instructions_text.get("1.0", tk.END).strip(),
             "favorite": self.recipe_favorite_var.get(),
             "categories": [cat for cat, var in self.category_vars.items() if var.get()],
             "ingredients": []
         }
         
-        # Process ingredients
-        for ingredient in self.ingredients:
-            # Skip empty ingredients
-            if not ingredient["ingredient_var"].get().strip():
-                continue
-                
-            ingredient_text = ingredient["ingredient_var"].get().strip()
-            recipe_data["ingredients"].append(ingredient_text)
+        # Process ingredients: one Tcl get per row, skipping blanks
+        recipe_data["ingredients"] = [
+            text for text in (entry.get().strip() for entry in self.ingredients.values())
+            if text
+        ]
         
         # Add recipe to database
         recipe_id = self.db.add_recipe(recipe_data)
         
         if recipe_id:
             messagebox.showinfo("Success", "Recipe added successfully!")
-            # Load the recipe detail view
-            self.load_recipe_detail(recipe_id)
-            # Refresh recipe list
-            self.load_recipe_list()
+            self._schedule_post_save_refresh(recipe_id)
         else:
             messagebox.showerror("Error", "Failed to add recipe")
+
+    def _schedule_post_save_refresh(self, recipe_id):
+        """Coalesce the post-save detail and list refreshes into one idle pass.
+
+        Running both in a single idle callback lets Tk batch the resulting
+        geometry work instead of re-laying out after each refresh.
+        """
+        self._post_save_recipe_id = recipe_id
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_post_save_refresh)
+
+    def _do_post_save_refresh(self):
+        """Run the combined detail + list refresh scheduled after a save."""
+        self._refresh_pending = False
+        self.load_recipe_detail(self._post_save_recipe_id)
+        self.load_recipe_list()
     
     def cancel_recipe_edit(self):
         """Cancel recipe editing and go back to recipe list view."""
         # Clear form
         self.recipe_form_frame.pack_forget()
-        
-        # Reset ingredients list
-        self.ingredients = []
-        
-        # Show recipe view frame
+
+        # Show recipe view frame; the inner panel is decided below
         self.recipe_view_frame.pack(fill="both", expand=True)
+        self._detail_pane_mode = "view"
 
         # If current recipe, reload it, otherwise show welcome message
-        if hasattr(self, 'current_recipe_id'):
+        if self.current_recipe_id is not None:
             self.load_recipe_detail(self.current_recipe_id)
         else:
-            # Clear recipe view
-            for widget in self.recipe_view_frame.winfo_children():
-                widget.destroy()
-            
-            # Add welcome message
-            welcome_label = ctk.CTkLabel(
-                self.recipe_view_frame, 
-                text="Welcome to Recipe Organization System",
-                font=("Arial", 20, "bold")
-            )
-            welcome_label.pack(pady=20)
-            
-            instruction_label = ctk.CTkLabel(
-                self.recipe_view_frame,
-                text="Select a recipe from the list on the left or create a new recipe.",
-                font=("Arial", 14)
-            )
-            instruction_label.pack(pady=10)
+            self._show_welcome_panel()
 
     def load_recipe_detail(self, recipe_id):
         """Load and display recipe details."""
@@ -1213,369 +1719,143 @@ class RecipeApp:
         if not recipe:
             messagebox.showerror("Error", "Recipe not found")
             return
-        
-        # Clear recipe view
-        for widget in self.recipe_view_frame.winfo_children():
-            widget.destroy()
-        
-        # Hide recipe form and show recipe view
-        self.recipe_form_frame.pack_forget()
-        self.recipe_view_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Recipe header (for buttons)
-        header_frame = ctk.CTkFrame(self.recipe_view_frame)
-        header_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Title frame for recipe name
-        title_frame = ctk.CTkFrame(self.recipe_view_frame)
-        title_frame.pack(fill="x", padx=10, pady=(0, 5))
-        
+
+        # Hide recipe form / welcome panel and show the persistent detail
+        # view, unless it is already the visible panel
+        if self._detail_pane_mode != "detail":
+            self.recipe_form_frame.pack_forget()
+            self.welcome_frame.pack_forget()
+            self.recipe_view_frame.pack(fill="both", expand=True, padx=5, pady=5)
+            self.recipe_detail_view.pack(fill="both", expand=True)
+            self._detail_pane_mode = "detail"
+
+        self._refresh_recipe_fields(recipe)
+
+    def _refresh_recipe_fields(self, recipe):
+        """Update the detail-view widgets in place from a recipe dict."""
         # Recipe title
-        title_label = ctk.CTkLabel(
-            title_frame, 
-            text=recipe["name"],
-            font=("Arial", 20, "bold")
-        )
-        title_label.pack(side="left", pady=5)
-        
+        self.detail_title_label.configure(text=recipe["name"])
+
         # Star for favorite recipes
         if recipe["favorite"]:
-            favorite_label = ctk.CTkLabel(
-                title_frame,
-                text="★",
-                font=("Arial", 18),
-                text_color=("gold", "gold")
-            )
-            favorite_label.pack(side="left", padx=5)
-        
-        # Button frame (now in the header_frame)
-        btn_frame = ctk.CTkFrame(header_frame)
-        btn_frame.pack(fill="x")
-        
-        # Edit button
-        edit_btn = ctk.CTkButton(
-            btn_frame, 
-            text="Edit", 
-            command=lambda: self.edit_recipe(recipe_id)
-        )
-        edit_btn.pack(side="left", padx=5, pady=5, expand=True, fill="x")
-        
-        # Delete button
-        delete_btn = ctk.CTkButton(
-            btn_frame, 
-            text="Delete", 
-            command=lambda: self.delete_recipe(recipe_id)
-        )
-        delete_btn.pack(side="left", padx=5, pady=5, expand=True, fill="x")
-        
-        # Add to shopping list button
-        add_to_shopping_btn = ctk.CTkButton(
-            btn_frame,
-            text="Add to Shopping List",
-            command=lambda: self.add_recipe_to_shopping_list(recipe_id)
-        )
-        add_to_shopping_btn.pack(side="left", padx=5, pady=5, expand=True, fill="x")
-        
+            self.detail_favorite_label.pack(side="left", padx=5)
+        else:
+            self.detail_favorite_label.pack_forget()
+
         # Categories if available
         if recipe["categories"]:
-            cat_frame = ctk.CTkFrame(self.recipe_view_frame)
-            cat_frame.pack(fill="x", padx=10, pady=5)
-            
-            cat_label = ctk.CTkLabel(
-                cat_frame,
-                text="Categories: " + ", ".join(recipe["categories"]),
-                font=("Arial", 12)
+            self.detail_cat_label.configure(
+                text="Categories: " + ", ".join(recipe["categories"])
             )
-            cat_label.pack(anchor="w")
-        
-        # Separator
-        separator = ctk.CTkFrame(self.recipe_view_frame, height=1, fg_color=("gray80", "gray30"))
-        separator.pack(fill="x", padx=10, pady=10)
-        
-        # Ingredients section
+            self.detail_cat_frame.pack(
+                fill="x", padx=10, pady=5, before=self.detail_separator
+            )
+        else:
+            self.detail_cat_frame.pack_forget()
+
+        # Ingredients section: assemble the block off-widget and hand Tk a
+        # single multiline label instead of one label per ingredient
         if recipe["ingredients"]:
-            ing_frame = ctk.CTkFrame(self.recipe_view_frame)
-            ing_frame.pack(fill="x", padx=10, pady=5)
-            
-            ing_title = ctk.CTkLabel(ing_frame, text="Ingredients", font=("Arial", 16, "bold"))
-            ing_title.pack(anchor="w", padx=10, pady=5)
-            
-            for ingredient in recipe["ingredients"]:
-                ing_label = ctk.CTkLabel(
-                    ing_frame,
-                    text=ingredient,
-                    anchor="w"
-                )
-                ing_label.pack(fill="x", padx=10, pady=2)
-        
-        # Instructions section
-        if recipe["instructions"]:
-            instr_frame = ctk.CTkFrame(self.recipe_view_frame)
-            instr_frame.pack(fill="x", padx=10, pady=5)
-            
-            instr_title = ctk.CTkLabel(instr_frame, text="Instructions", font=("Arial", 16, "bold"))
-            instr_title.pack(anchor="w", padx=10, pady=5)
-            
-            instr_text = ctk.CTkLabel(
-                instr_frame,
-                text=recipe["instructions"],
-                wraplength=600,
-                justify="left"
+            self.detail_ing_label.configure(text="\n".join(recipe["ingredients"]))
+            self.detail_ing_frame.pack(
+                fill="x", padx=10, pady=5, before=self.detail_bottom_anchor
             )
-            instr_text.pack(fill="x", padx=10, pady=5)
-    
-    def edit_recipe(self, recipe_id):
-        """Edit an existing recipe."""
-        # Get recipe data
-        recipe = self.db.get_recipe(recipe_id)
-        
-        if not recipe:
-            messagebox.showerror("Error", "Recipe not found")
-            return
-        
-        # Clear the recipe detail view
-        for widget in self.recipe_view_frame.winfo_children():
-            widget.destroy()
-        
-        # Hide recipe view and show recipe form frame
-        self.recipe_view_frame.pack_forget()
-        
-        # Clear form frame and recreate as scrollable frame
-        for widget in self.recipe_form_frame.winfo_children():
-            widget.destroy()
-        
-        self.recipe_form_frame = ctk.CTkScrollableFrame(
-            self.recipe_detail_frame,
-            label_text=f"Edit Recipe: {recipe['name']}"
-        )
-        self.recipe_form_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # IMPORTANT: Reset the ingredients list to empty
-        self.ingredients = []
-        
-        # Create form header with large title
-        heading = ctk.CTkLabel(
-            self.recipe_form_frame, 
-            text=f"Edit Recipe: {recipe['name']}", 
-            font=("Arial", 20, "bold")
-        )
-        heading.pack(pady=10)
-        
-        # Basic info section
-        basic_frame = ctk.CTkFrame(self.recipe_form_frame)
-        basic_frame.pack(fill="x", padx=10, pady=5)
-        
-        basic_label = ctk.CTkLabel(basic_frame, text="Basic Information", font=("Arial", 14, "bold"))
-        basic_label.pack(anchor="w", padx=5, pady=5)
-        
-        # Name field
-        name_frame = ctk.CTkFrame(basic_frame)
-        name_frame.pack(fill="x", padx=5, pady=5)
-        
-        name_label = ctk.CTkLabel(name_frame, text="Recipe Name:")
-        name_label.pack(side="left", padx=5)
-        
-        self.recipe_name_var = ctk.StringVar(value=recipe["name"])
-        name_entry = ctk.CTkEntry(name_frame, textvariable=self.recipe_name_var, width=300)
-        name_entry.pack(side="left", padx=5)
-        
-        # Favorite checkbox
-        self.recipe_favorite_var = ctk.BooleanVar(value=recipe["favorite"])
-        favorite_check = ctk.CTkCheckBox(name_frame, text="Favorite", variable=self.recipe_favorite_var)
-        favorite_check.pack(side="left", padx=5)
-        
-        # Categories section
-        cat_frame = ctk.CTkFrame(self.recipe_form_frame)
-        cat_frame.pack(fill="x", padx=10, pady=10)
-        
-        cat_label = ctk.CTkLabel(cat_frame, text="Categories", font=("Arial", 14, "bold"))
-        cat_label.pack(anchor="w", padx=5, pady=5)
-        
-        # Replace the tk.Listbox with a scrollable frame containing checkboxes
-        self.categories_scrollable = ctk.CTkScrollableFrame(cat_frame, height=150)
-        self.categories_scrollable.pack(fill="x", padx=5, pady=5)
-        
-        # Get all categories
-        all_categories = self.db.get_all_categories()
-        
-        # Dictionary to store category checkbox variables
-        self.category_vars = {}
-        
-        # Create a checkbox for each category, check those that belong to the recipe
-        for category in all_categories:
-            var = ctk.BooleanVar(value=category in recipe["categories"])
-            self.category_vars[category] = var
-            checkbox = ctk.CTkCheckBox(self.categories_scrollable, text=category, variable=var)
-            checkbox.pack(anchor="w", padx=5, pady=2)
-        
-        # New category button
-        new_cat_btn = ctk.CTkButton(
-            cat_selection_frame, 
-            text="New Category", 
-            command=self.add_new_category
-        )
-        new_cat_btn.pack(side="left", padx=5)
-        
-        # Ingredients section
-        ingredients_frame = ctk.CTkFrame(self.recipe_form_frame)
-        ingredients_frame.pack(fill="x", padx=10, pady=10)
-        
-        ing_label = ctk.CTkLabel(ingredients_frame, text="Ingredients", font=("Arial", 14, "bold"))
-        ing_label.pack(anchor="w", padx=5, pady=5)
-        
-        # Ingredients list
-        self.ingredients_list_frame = ctk.CTkFrame(ingredients_frame)
-        self.ingredients_list_frame.pack(fill="x", padx=5, pady=5)
-        
-        # Add existing ingredients
-        for ingredient_text in recipe["ingredients"]:
-            self.add_ingredient_row_with_text(ingredient_text)
-        
-        # Add ingredient button
-        add_ing_btn = ctk.CTkButton(
-            ingredients_frame, 
-            text="Add Ingredient", 
-            command=self.add_ingredient_row
-        )
-        add_ing_btn.pack(padx=5, pady=5)
-        
+        else:
+            self.detail_ing_frame.pack_forget()
+
         # Instructions section
-        instr_frame = ctk.CTkFrame(self.recipe_form_frame)
-        instr_frame.pack(fill="x", padx=10, pady=10)
-        
-        instr_label = ctk.CTkLabel(instr_frame, text="Instructions", font=("Arial", 14, "bold"))
-        instr_label.pack(anchor="w", padx=5, pady=5)
-        
-        self.instructions_text = ctk.CTkTextbox(instr_frame, height=150, wrap="word")
-        self.instructions_text.pack(fill="x", padx=5, pady=5)
-        self.instructions_text.insert("1.0", recipe["instructions"])
-        
-        # Button frame
-        btn_frame = ctk.CTkFrame(self.recipe_form_frame)
-        btn_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Save button
-        save_btn = ctk.CTkButton(
-            btn_frame, 
-            text="Save Changes", 
-            command=lambda: self.save_recipe_changes(recipe_id)
-        )
-        save_btn.pack(side="left", padx=5)
-        
-        # Cancel button
-        cancel_btn = ctk.CTkButton(
-            btn_frame, 
-            text="Cancel", 
-            command=self.cancel_recipe_edit
-        )
-        cancel_btn.pack(side="left", padx=5)
+        self.detail_instr_frame.pack_forget()
+        if recipe["instructions"]:
+            self.detail_instr_label.configure(text=recipe["instructions"])
+            self.detail_instr_frame.pack(
+                fill="x", padx=10, pady=5, before=self.detail_bottom_anchor
+            )
     
+    def edit_recipe(self, recipe_id):
+        """Edit an existing recipe."""
+        # Get recipe data
+        recipe = self.db.get_recipe(recipe_id)
+        
+        if not recipe:
+            messagebox.showerror("Error", "Recipe not found")
+            return
+
+        self._open_recipe_form(recipe)
+
+    def _chunked_insert(self, textbox, text, gen, offset=0, chunk_size=4096):
+        """Insert text into a textbox in chunks so the mainloop stays live.
+
+        gen is the _instr_fill_gen value captured when the fill was
+        scheduled; reopening the form bumps the counter, so a cascade
+        still pending for the previous recipe stops instead of writing
+        into the reused textbox.
+        """
+        if gen != self._instr_fill_gen or not textbox.winfo_exists():
+            return
+        chunk = text[offset:offset + chunk_size]
+        if chunk:
+            textbox.insert("end", chunk)
+        if offset + chunk_size < len(text):
+            self.root.after(
+                0, self._chunked_insert, textbox, text, gen,
+                offset + chunk_size, chunk_size
+            )
+
     def add_ingredient_row_with_text(self, ingredient_text):
         """Add a new ingredient row with provided text."""
         row_frame = ctk.CTkFrame(self.ingredients_list_frame)
         row_frame.pack(fill="x", padx=5, pady=2)
         
-        # Ingredient text field
-        ingredient_var = ctk.StringVar(value=ingredient_text)
-        ingredient_entry = ctk.CTkEntry(row_frame, textvariable=ingredient_var, width=300)
+        # Ingredient text field pre-filled with the existing text; no Tcl
+        # variable needed since it's only read back at save time
+        ingredient_entry = ctk.CTkEntry(row_frame, width=300)
+        ingredient_entry.insert(0, ingredient_text)
         ingredient_entry.pack(side="left", padx=2, fill="x", expand=True)
-        
-        # Remove button
+
+        # Remove button; the closure owns the frame, so the list only needs
+        # to hold the entry itself rather than a dict per row
         def remove_ingredient():
             row_frame.destroy()
-            self.ingredients.remove(ingredient_data)
-        
+            self.ingredients.pop(id(ingredient_entry), None)
+
         remove_btn = ctk.CTkButton(row_frame, text="X", width=30, command=remove_ingredient)
         remove_btn.pack(side="left", padx=2)
-        
-        # Store the ingredient data
-        ingredient_data = {
-            "row_frame": row_frame,
-            "ingredient_var": ingredient_var
-        }
-        
-        self.ingredients.append(ingredient_data)
-        
-        return ingredient_data
+
+        self.ingredients[id(ingredient_entry)] = ingredient_entry
+
+        return ingredient_entry
     
     def save_recipe_changes(self, recipe_id):
         """Save changes to an existing recipe."""
         # Validate required fields
-        if not self.recipe_name_var.get().strip():
+        if not self.recipe_name_entry.get().strip():
             messagebox.showerror("Error", "Recipe name is required")
             return
         
         # Gather recipe data
         recipe_data = {
-            "name": self.recipe_name_var.get().strip(),
+            "name": self.recipe_name_entry.get().strip(),
             "instructions": self.instructions_text.get("1.0", "end-1c").strip(),
             "favorite": self.recipe_favorite_var.get(),
-            "categories": [self.cat_listbox.get(idx) for idx in self.cat_listbox.curselection()],
+            "categories": [cat for cat, var in self.category_vars.items() if var.get()],
             "ingredients": []
         }
-        
-        # Process ingredients
-        for ingredient in self.ingredients:
-            # Skip empty ingredients
-            if not ingredient["ingredient_var"].get().strip():
-                continue
-                
-            ingredient_text = ingredient["ingredient_var"].get().strip()
-            recipe_data["ingredients"].append(ingredient_text)
-        
+
+        # Process ingredients: one Tcl get per row, skipping blanks
+        recipe_data["ingredients"] = [
+            text for text in (entry.get().strip() for entry in self.ingredients.values())
+            if text
+        ]
+
         # Update recipe in database
         success = self.db.update_recipe(recipe_id, recipe_data)
         
         if success:
             messagebox.showinfo("Success", "Recipe updated successfully!")
-            # Reset ingredients list after successful save
-            self.ingredients = []
-            # Load the recipe detail view
-            self.load_recipe_detail(recipe_id)
-            # Refresh recipe list
-            self.load_recipe_list()
+            self._schedule_post_save_refresh(recipe_id)
         else:
             messagebox.showerror("Error", "Failed to update recipe")
 
-    def save_new_recipe(self):
-        """Save a new recipe to the database."""
-        # Validate required fields
-        if not self.recipe_name_var.get().strip():
-            messagebox.showerror("Error", "Recipe name is required")
-            return
-        
-        # Gather recipe data
-        recipe_data = {
-            "name": self.recipe_name_var.get().strip(),
-            "instructions": self.instructions_text.get("1.0", tk.END).strip(),
-            "favorite": self.recipe_favorite_var.get(),
-            "categories": [self.cat_listbox.get(idx) for idx in self.cat_listbox.curselection()],
-            "ingredients": []
-        }
-        
-        # Process ingredients
-        for ingredient in self.ingredients:
-            # Skip empty ingredients
-            if not ingredient["ingredient_var"].get().strip():
-                continue
-                
-            ingredient_text = ingredient["ingredient_var"].get().strip()
-            recipe_data["ingredients"].append(ingredient_text)
-        
-        # Add recipe to database
-        recipe_id = self.db.add_recipe(recipe_data)
-        
-        if recipe_id:
-            messagebox.showinfo("Success", "Recipe added successfully!")
-            # Reset ingredients list after successful save
-            self.ingredients = []
-            # Load the recipe detail view
-            self.load_recipe_detail(recipe_id)
-            # Refresh recipe list
-            self.load_recipe_list()
-        else:
-            messagebox.showerror("Error", "Failed to add recipe")
-    
     def delete_recipe(self, recipe_id):
         """Delete a recipe."""
         # Confirm deletion
@@ -1593,31 +1873,11 @@ class RecipeApp:
         if success:
             messagebox.showinfo("Success", "Recipe deleted successfully!")
             # Clear current recipe ID
-            if hasattr(self, 'current_recipe_id'):
-                delattr(self, 'current_recipe_id')
-            
-            # Clear recipe detail view
-            for widget in self.recipe_view_frame.winfo_children():
-                widget.destroy()
-            
-            # Reset ingredients list
-            self.ingredients = []
-            
+            self.current_recipe_id = None
+
             # Show welcome message
-            welcome_label = ctk.CTkLabel(
-                self.recipe_view_frame, 
-                text="Welcome to Recipe Organization System",
-                font=("Arial", 20, "bold")
-            )
-            welcome_label.pack(pady=20)
-            
-            instruction_label = ctk.CTkLabel(
-                self.recipe_view_frame,
-                text="Select a recipe from the list on the left or create a new recipe.",
-                font=("Arial", 14)
-            )
-            instruction_label.pack(pady=10)
-            
+            self._show_welcome_panel()
+
             # Refresh recipe list
             self.load_recipe_list()
         else:
@@ -1625,7 +1885,6 @@ class RecipeApp:
     
     def add_recipe_to_shopping_list(self, recipe_id):
         """Add a recipe's ingredients to a shopping list."""
-        import tkinter as tk
         
         # Get recipe data
         recipe = self.db.get_recipe(recipe_id)
@@ -1673,9 +1932,8 @@ class RecipeApp:
         listbox.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Populate options
-        for option in options:
-            listbox.insert("end", option)
+        # Populate options in one Tcl call instead of one per item
+        listbox.insert("end", *options)
         
         # Select first option by default
         listbox.selection_set(0)
@@ -1767,9 +2025,8 @@ class RecipeApp:
             list_listbox.pack(side="left", fill="both", expand=True)
             list_scrollbar.pack(side="right", fill="y")
             
-            # Populate options
-            for shopping_list in existing_lists:
-                list_listbox.insert("end", shopping_list["name"])
+            # Populate options in one Tcl call instead of one per item
+            list_listbox.insert("end", *[sl["name"] for sl in existing_lists])
             
             # Select first option by default
             if existing_lists:
@@ -1911,37 +2168,61 @@ class RecipeApp:
         )
         gen_list_btn.pack(side="left", padx=5)
         
-        # Create scrollable frame for shopping lists instead of canvas
-        self.shopping_lists_scrollable = ctk.CTkScrollableFrame(
-            self.shopping_list_frame,
-            label_text="Your Shopping Lists"
-        )
-        self.shopping_lists_scrollable.pack(fill="both", expand=True, padx=5, pady=5)
-        
+        # Treeview sidebar: one native widget draws only the visible rows,
+        # so the list stays cheap no matter how many shopping lists exist
+        tree_frame = tk.Frame(self.shopping_list_frame)
+        tree_frame.pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.shopping_list_tree = ttk.Treeview(
+            tree_frame,
+            columns=("date",),
+            show="tree",
+            selectmode="browse"
+        )
+        self.shopping_list_tree.column("#0", width=160, stretch=True)
+        self.shopping_list_tree.column("date", width=100, anchor="w")
+
+        list_scrollbar = ctk.CTkScrollbar(tree_frame, command=self.shopping_list_tree.yview)
+        list_scrollbar.pack(side="right", fill="y")
+        self.shopping_list_tree.configure(yscrollcommand=list_scrollbar.set)
+        self.shopping_list_tree.pack(side="left", fill="both", expand=True)
+
+        self.shopping_list_tree.bind("<<TreeviewSelect>>", self.on_shopping_list_select)
+
         # Load shopping lists
         self.load_shopping_lists()
 
+    def on_shopping_list_select(self, event):
+        """Handle shopping list selection from the treeview."""
+        selection = self.shopping_list_tree.selection()
+        # Ignore the placeholder row, whose iid is not a list id
+        if selection and selection[0].isdigit():
+            self.load_shopping_list_detail(int(selection[0]))
+
     def load_shopping_lists(self):
         """Load shopping lists into the list view."""
         # Clear existing items
-        for widget in self.shopping_lists_scrollable.winfo_children():
-            widget.destroy()
-        
+        self.shopping_list_tree.delete(*self.shopping_list_tree.get_children())
+
         # Get shopping lists
         shopping_lists = self.db.get_shopping_lists()
-        
+
         if not shopping_lists:
             # Show no lists message
-            no_lists = ctk.CTkLabel(
-                self.shopping_lists_scrollable, 
-                text="No shopping lists found",
-                font=("Arial", 12)
+            self.shopping_list_tree.insert(
+                "", "end", iid="no-lists", text="No shopping lists found"
             )
-            no_lists.pack(fill="x", padx=10, pady=10)
         else:
-            # Add shopping list items
             for shopping_list in shopping_lists:
-                self.create_shopping_list_item(shopping_list)
+                date_str = ""
+                if shopping_list["date_created"]:
+                    date_str = format_db_date(shopping_list["date_created"])
+                self.shopping_list_tree.insert(
+                    "", "end",
+                    iid=str(shopping_list["id"]),
+                    text=shopping_list["name"],
+                    values=(date_str,)
+                )
 
     def new_shopping_list(self):
         """Create a new shopping list."""
@@ -1957,56 +2238,6 @@ class RecipeApp:
         self.load_shopping_lists()
         self.load_shopping_list_detail(shopping_list_id)
 
-    def create_shopping_list_item(self, shopping_list):
-        # Create frame for shopping list item
-        list_frame = ctk.CTkFrame(self.shopping_lists_scrollable)
-        list_frame.pack(fill="x", padx=5, pady=5)
-        list_frame.shopping_list_id = shopping_list["id"]
-        list_frame.bind("<Button-1>", lambda e, l=shopping_list: self.select_shopping_list(l["id"], list_frame))
-        
-        # Create list item content
-        name_label = ctk.CTkLabel(
-            list_frame, 
-            text=shopping_list["name"],
-            font=("Arial", 14, "bold")
-        )
-        name_label.pack(anchor="w", padx=5, pady=2)
-        name_label.bind("<Button-1>", lambda e, l=shopping_list: self.select_shopping_list(l["id"], list_frame))
-    
-        
-        # Add date if available
-        if shopping_list["date_created"]:
-            try:
-                date_obj = datetime.datetime.strptime(shopping_list["date_created"], "%Y-%m-%d %H:%M:%S")
-                date_str = date_obj.strftime("%b %d, %Y")
-            except:
-                date_str = shopping_list["date_created"]
-                
-            date_label = ctk.CTkLabel(
-                list_frame, 
-                text=date_str,
-                text_color=("gray50", "gray70")  # Subdued color
-            )
-            date_label.pack(anchor="w", padx=5)
-            date_label.bind("<Button-1>", lambda e, l=shopping_list: self.load_shopping_list_detail(l["id"]))
-        
-        # Add separator
-        separator = ctk.CTkFrame(self.shopping_lists_scrollable, height=1, fg_color=("gray80", "gray30"))
-        separator.pack(fill="x", padx=10, pady=2)
-    
-    def select_shopping_list(self, shopping_list_id, selected_frame):
-        """Handle shopping list selection and highlighting."""
-        # Load the shopping list detail
-        self.load_shopping_list_detail(shopping_list_id)
-        
-        # Remove highlight from all shopping list frames
-        for child in self.shopping_lists_scrollable.winfo_children():
-            if isinstance(child, ctk.CTkFrame) and hasattr(child, 'shopping_list_id'):
-                child.configure(fg_color=("gray90", "gray20"))  # Reset to default color
-        
-        # Highlight the selected frame
-        selected_frame.configure(fg_color=("lightblue", "navy"))  # Highlight color
-
     def setup_shopping_detail(self):
         """Set up the shopping list detail part of the shopping tab."""
         # Create view for shopping list details
@@ -2015,149 +2246,202 @@ class RecipeApp:
             label_text="Shopping List Details"
         )
         self.shopping_view_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Initially show a welcome message in detail view
+
+        # Persistent welcome panel, shown while no list is selected
+        self.shopping_welcome_frame = ctk.CTkFrame(self.shopping_view_frame)
         welcome_label = ctk.CTkLabel(
-            self.shopping_view_frame, 
+            self.shopping_welcome_frame,
             text="Shopping Lists",
             font=("Arial", 20, "bold")
         )
         welcome_label.pack(pady=20)
-        
+
         instruction_label = ctk.CTkLabel(
-            self.shopping_view_frame,
+            self.shopping_welcome_frame,
             text="Select a shopping list from the left or create a new one.",
             font=("Arial", 14)
         )
         instruction_label.pack(pady=10)
+        self.shopping_welcome_frame.pack(fill="both", expand=True)
 
-    def load_shopping_list_detail(self, shopping_list_id):
-        """Load shopping list details into the detail view."""
-        # Clear current view
-        for widget in self.shopping_view_frame.winfo_children():
-            widget.destroy()
-        
-        # Get shopping list details
-        shopping_list = self.db.get_shopping_list(shopping_list_id)
-        
-        if not shopping_list:
-            messagebox.showerror("Error", "Shopping list not found")
-            return
-        
-        # Store current shopping list ID
-        self.current_shopping_list_id = shopping_list_id
-        
-        # Create header frame
-        header_frame = ctk.CTkFrame(self.shopping_view_frame)
+        # Persistent detail scaffold: header, date line and items container
+        # are built once, and loads only reconfigure them
+        self.shopping_detail_view = ctk.CTkFrame(self.shopping_view_frame)
+
+        header_frame = ctk.CTkFrame(self.shopping_detail_view)
         header_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Shopping list title
-        title = ctk.CTkLabel(
-            header_frame, 
-            text=shopping_list["name"], 
+
+        self.shopping_title_label = ctk.CTkLabel(
+            header_frame,
+            text="",
             font=("Arial", 18, "bold")
         )
-        title.pack(side="left", padx=5)
-        
-        # Actions frame on right
+        self.shopping_title_label.pack(side="left", padx=5)
+
+        # Actions frame on right; buttons act on the current list
         actions_frame = ctk.CTkFrame(header_frame)
         actions_frame.pack(side="right", padx=5)
-        
-        # Add item button
+
         add_item_btn = ctk.CTkButton(
-            actions_frame, 
-            text="Add Item", 
-            command=lambda: self.add_shopping_list_item(shopping_list_id)
+            actions_frame,
+            text="Add Item",
+            command=lambda: self.add_shopping_list_item(self.current_shopping_list_id)
         )
         add_item_btn.pack(side="left", padx=2)
-        
-        # Delete button
+
         delete_btn = ctk.CTkButton(
-            actions_frame, 
-            text="Delete List", 
-            command=lambda: self.delete_shopping_list(shopping_list_id),
+            actions_frame,
+            text="Delete List",
+            command=lambda: self.delete_shopping_list(self.current_shopping_list_id),
             fg_color="darkred",
             hover_color="red"
         )
         delete_btn.pack(side="left", padx=2)
-        
+
+        # Created-date line; packed only when the list has one
+        self.shopping_date_label = ctk.CTkLabel(
+            self.shopping_detail_view,
+            text="",
+            text_color=("gray50", "gray70")
+        )
+
+        # Persistent items container; its pooled rows survive reloads so a
+        # detail switch reconfigures widgets instead of recreating them
+        self.shopping_items_frame = ctk.CTkFrame(self.shopping_detail_view)
+        self.shopping_items_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        self.shopping_no_items_label = ctk.CTkLabel(
+            self.shopping_items_frame,
+            text="No items in this shopping list",
+            font=("Arial", 12)
+        )
+        self._shopping_item_rows = []
+
+    def _show_shopping_welcome_panel(self):
+        """Show the shopping welcome panel in place of the detail view."""
+        self.shopping_detail_view.pack_forget()
+        self.shopping_welcome_frame.pack(fill="both", expand=True)
+
+    def _queue_check_update(self, item_id, checked):
+        """Queue a checkbox toggle; repeated toggles of one item coalesce."""
+        self._pending_check_updates[item_id] = checked
+        if self._check_flush_job is None:
+            self._check_flush_job = self.root.after(250, self._flush_check_updates)
+
+    def _flush_check_updates(self):
+        """Write all queued checkbox toggles in a single transaction."""
+        if self._check_flush_job is not None:
+            self.root.after_cancel(self._check_flush_job)
+            self._check_flush_job = None
+        if not self._pending_check_updates:
+            return
+        updates = self._pending_check_updates
+        self._pending_check_updates = {}
+        self.db.update_shopping_list_items_checked(updates.items())
+
+    def load_shopping_list_detail(self, shopping_list_id):
+        """Load shopping list details into the detail view."""
+        # Flush queued toggles first so the reload reads current state
+        self._flush_check_updates()
+
+        # Get shopping list details
+        shopping_list = self.db.get_shopping_list(shopping_list_id)
+
+        if not shopping_list:
+            messagebox.showerror("Error", "Shopping list not found")
+            return
+
+        # Store current shopping list ID
+        self.current_shopping_list_id = shopping_list_id
+
+        # Swap in the persistent detail scaffold
+        self.shopping_welcome_frame.pack_forget()
+        self.shopping_detail_view.pack(fill="both", expand=True)
+
+        # Shopping list title
+        self.shopping_title_label.configure(text=shopping_list["name"])
+
         # Created date if available
         if shopping_list["date_created"]:
-            try:
-                date_obj = datetime.datetime.strptime(shopping_list["date_created"], "%Y-%m-%d %H:%M:%S")
-                date_str = date_obj.strftime("%B %d, %Y")
-            except:
-                date_str = shopping_list["date_created"]
-                
-            date_label = ctk.CTkLabel(
-                self.shopping_view_frame, 
-                text=f"Created: {date_str}",
-                text_color=("gray50", "gray70")
+            date_str = format_db_date(shopping_list["date_created"], full=True)
+            self.shopping_date_label.configure(text=f"Created: {date_str}")
+            self.shopping_date_label.pack(
+                anchor="w", padx=10, pady=2, before=self.shopping_items_frame
             )
-            date_label.pack(anchor="w", padx=10, pady=2)
-        
-        # Create items container
-        items_frame = ctk.CTkFrame(self.shopping_view_frame)
-        items_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Add items
-        if not shopping_list["items"]:
-            no_items = ctk.CTkLabel(
-                items_frame, 
-                text="No items in this shopping list",
-                font=("Arial", 12)
-            )
-            no_items.pack(fill="x", padx=10, pady=10)
         else:
-            for item in shopping_list["items"]:
-                self.create_shopping_item_row(items_frame, item)
+            self.shopping_date_label.pack_forget()
+
+        # Fill the pooled rows from the item list, growing the pool only
+        # when this list is longer than any seen before
+        items = shopping_list["items"]
+        for i, item in enumerate(items):
+            if i < len(self._shopping_item_rows):
+                row = self._shopping_item_rows[i]
+            else:
+                row = self._make_shopping_item_row()
+                self._shopping_item_rows.append(row)
+            row["id"] = item["id"]
+            row["checked_var"].set(item["checked"])
+            row["item_var"].set(item["item_text"])
+            row["frame"].pack(fill="x", padx=5, pady=2)
+        for row in self._shopping_item_rows[len(items):]:
+            row["frame"].pack_forget()
+
+        if items:
+            self.shopping_no_items_label.pack_forget()
+        else:
+            self.shopping_no_items_label.pack(fill="x", padx=10, pady=10)
+
+    def _make_shopping_item_row(self):
+        """Create one pooled shopping-item row.
+
+        The callbacks read the row dict's current "id" at call time, so a
+        recycled row acts on whatever item it last displayed without any
+        rebinding.
+        """
+        row = {"id": None}
+        row_frame = ctk.CTkFrame(self.shopping_items_frame)
+
+        # Checkbox; toggles are queued and written in one batch
+        checked_var = ctk.BooleanVar()
 
-    def create_shopping_item_row(self, parent, item):
-        """Create a shopping list item row."""
-        row_frame = ctk.CTkFrame(parent)
-        row_frame.pack(fill="x", padx=5, pady=2)
-        
-        # Checkbox
-        checked_var = ctk.BooleanVar(value=item["checked"])
-        
         def update_checked():
-            self.db.update_shopping_list_item(item["id"], checked=checked_var.get())
-        
+            self._queue_check_update(row["id"], checked_var.get())
+
         check = ctk.CTkCheckBox(
-            row_frame, 
+            row_frame,
             text="",
-            variable=checked_var, 
+            variable=checked_var,
             command=update_checked
         )
         check.pack(side="left")
-        
+
         # Item text (editable)
-        item_var = ctk.StringVar(value=item["item_text"])
+        item_var = ctk.StringVar()
         item_entry = ctk.CTkEntry(
-            row_frame, 
-            textvariable=item_var, 
+            row_frame,
+            textvariable=item_var,
             width=300
         )
         item_entry.pack(side="left", padx=5, fill="x", expand=True)
-        
+
         # Update function for the entry
         def update_item_text(event=None):
             new_text = item_var.get().strip()
             if new_text:
-                self.db.update_shopping_list_item(item["id"], item_text=new_text)
-        
+                self.db.update_shopping_list_item(row["id"], item_text=new_text)
+
         # Bind update to Return key and focus out event
         item_entry.bind("<Return>", update_item_text)
         item_entry.bind("<FocusOut>", update_item_text)
-        
-        # Delete button
+
+        # Delete button; reload keeps the pool's packing order intact
         def delete_item():
-            self.db.delete_shopping_list_item(item["id"])
-            row_frame.destroy()
-        
+            self.db.delete_shopping_list_item(row["id"])
+            self.load_shopping_list_detail(self.current_shopping_list_id)
+
         delete_btn = ctk.CTkButton(
-            row_frame, 
-            text="X", 
+            row_frame,
+            text="X",
             width=30,
             command=delete_item,
             fg_color="darkred",
@@ -2165,6 +2449,9 @@ class RecipeApp:
         )
         delete_btn.pack(side="left", padx=2)
 
+        row.update(frame=row_frame, checked_var=checked_var, item_var=item_var)
+        return row
+
     def add_shopping_list_item(self, shopping_list_id):
         """Add an item to the shopping list."""
         # Prompt for item text
@@ -2195,28 +2482,11 @@ class RecipeApp:
         if success:
             messagebox.showinfo("Success", "Shopping list deleted successfully!")
             # Clear current shopping list ID
-            if hasattr(self, 'current_shopping_list_id'):
-                delattr(self, 'current_shopping_list_id')
-            
-            # Clear shopping detail view
-            for widget in self.shopping_view_frame.winfo_children():
-                widget.destroy()
-            
+            self.current_shopping_list_id = None
+
             # Show welcome message
-            welcome_label = ctk.CTkLabel(
-                self.shopping_view_frame, 
-                text="Shopping Lists",
-                font=("Arial", 20, "bold")
-            )
-            welcome_label.pack(pady=20)
-            
-            instruction_label = ctk.CTkLabel(
-                self.shopping_view_frame,
-                text="Select a shopping list from the left or create a new one.",
-                font=("Arial", 14)
-            )
-            instruction_label.pack(pady=10)
-            
+            self._show_shopping_welcome_panel()
+
             # Refresh shopping lists
             self.load_shopping_lists()
         else:
@@ -2224,8 +2494,6 @@ class RecipeApp:
     
     def export_all_recipes(self):
         """Export all recipes to a JSON file."""
-        import json
-        import tkinter.filedialog as filedialog
         
         # Get all recipes
         recipes = self.db.export_recipes_to_json()
@@ -2244,19 +2512,15 @@ class RecipeApp:
         if not file_path:
             return  # User cancelled
         
-        try:
-            # Write to file
-            with open(file_path, 'w') as f:
-                json.dump(recipes, f, indent=4)
-            
-            messagebox.showinfo("Export Successful", f"Successfully exported {len(recipes)} recipes to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting recipes: {str(e)}")
+        # Write to file off the Tk thread
+        self._write_json_async(
+            recipes, file_path,
+            f"Successfully exported {len(recipes)} recipes to {file_path}",
+            "Error exporting recipes"
+        )
 
     def export_selected_recipes(self):
         """Export selected recipes to a JSON file."""
-        import json
-        import tkinter as tk
         
         # Create a dialog to select recipes
         dialog = ctk.CTkToplevel(self.root)
@@ -2293,9 +2557,8 @@ class RecipeApp:
         # Get all recipes
         recipes = self.db.get_all_recipes()
         
-        # Populate listbox with recipes
-        for recipe in recipes:
-            recipe_listbox.insert("end", recipe["name"])
+        # Populate listbox with recipes in one Tcl call
+        recipe_listbox.insert("end", *[recipe["name"] for recipe in recipes])
         
         # Store recipe IDs for later
         recipe_ids = [recipe["id"] for recipe in recipes]
@@ -2331,20 +2594,14 @@ class RecipeApp:
                 if not file_path:
                     return  # User cancelled
                 
-                try:
-                    # Export selected recipes
-                    recipes_to_export = self.db.export_recipes_to_json(selected_recipe_ids)
-                    
-                    # Write to file
-                    with open(file_path, 'w') as f:
-                        json.dump(recipes_to_export, f, indent=4)
-                    
-                    messagebox.showinfo(
-                        "Export Successful", 
-                        f"Successfully exported {len(recipes_to_export)} recipes to {file_path}"
-                    )
-                except Exception as e:
-                    messagebox.showerror("Export Error", f"Error exporting recipes: {str(e)}")
+                # Export selected recipes; the file write happens off the
+                # Tk thread
+                recipes_to_export = self.db.export_recipes_to_json(selected_recipe_ids)
+                self._write_json_async(
+                    recipes_to_export, file_path,
+                    f"Successfully exported {len(recipes_to_export)} recipes to {file_path}",
+                    "Error exporting recipes"
+                )
         
         # Export button
         export_btn = ctk.CTkButton(
@@ -2476,7 +2733,35 @@ class RecipeApp:
             command=self.import_shopping_lists
         )
         import_lists_btn.pack(side="left", padx=5)
-        
+
+        # Database section
+        db_frame = ctk.CTkFrame(main_frame)
+        db_frame.pack(fill="x", pady=10)
+
+        db_label = ctk.CTkLabel(
+            db_frame,
+            text="Database",
+            font=("Arial", 16, "bold")
+        )
+        db_label.pack(anchor="w", padx=10, pady=5)
+
+        db_btn_frame = ctk.CTkFrame(db_frame)
+        db_btn_frame.pack(fill="x", pady=5, padx=10)
+
+        backup_db_btn = ctk.CTkButton(
+            db_btn_frame,
+            text="Backup Database",
+            command=self.backup_database
+        )
+        backup_db_btn.pack(side="left", padx=5)
+
+        restore_db_btn = ctk.CTkButton(
+            db_btn_frame,
+            text="Restore Database",
+            command=self.restore_database
+        )
+        restore_db_btn.pack(side="left", padx=5)
+
         # Information section
         info_frame = ctk.CTkFrame(main_frame)
         info_frame.pack(fill="x", pady=10)
@@ -2508,7 +2793,6 @@ class RecipeApp:
 
     def generate_from_recipes(self):
         """Generate a shopping list from recipes."""
-        import tkinter as tk
         
         # Create recipe selection dialog using CTk
         dialog = ctk.CTkToplevel(self.root)
@@ -2545,9 +2829,8 @@ class RecipeApp:
         # Get all recipes
         recipes = self.db.get_all_recipes()
         
-        # Populate listbox with recipes
-        for recipe in recipes:
-            recipe_listbox.insert("end", recipe["name"])
+        # Populate listbox with recipes in one Tcl call
+        recipe_listbox.insert("end", *[recipe["name"] for recipe in recipes])
         
         # Store recipe IDs for later
         recipe_ids = [recipe["id"] for recipe in recipes]
@@ -2607,8 +2890,6 @@ class RecipeApp:
 
     def export_all_shopping_lists(self):
         """Export all shopping lists to a JSON file."""
-        import json
-        import tkinter.filedialog as filedialog
         
         # Get all shopping lists
         shopping_lists = self.db.export_shopping_lists_to_json()
@@ -2627,22 +2908,15 @@ class RecipeApp:
         if not file_path:
             return  # User cancelled
         
-        try:
-            # Write to file
-            with open(file_path, 'w') as f:
-                json.dump(shopping_lists, f, indent=4)
-            
-            messagebox.showinfo(
-                "Export Successful", 
-                f"Successfully exported {len(shopping_lists)} shopping lists to {file_path}"
-            )
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting shopping lists: {str(e)}")
+        # Write to file off the Tk thread
+        self._write_json_async(
+            shopping_lists, file_path,
+            f"Successfully exported {len(shopping_lists)} shopping lists to {file_path}",
+            "Error exporting shopping lists"
+        )
 
     def export_selected_shopping_lists(self):
         """Export selected shopping lists to a JSON file."""
-        import json
-        import tkinter as tk
         
         # Create a dialog to select shopping lists
         dialog = ctk.CTkToplevel(self.root)
@@ -2679,9 +2953,8 @@ class RecipeApp:
         # Get all shopping lists
         shopping_lists = self.db.get_shopping_lists()
         
-        # Populate listbox with shopping lists
-        for shopping_list in shopping_lists:
-            list_listbox.insert("end", shopping_list["name"])
+        # Populate listbox with shopping lists in one Tcl call
+        list_listbox.insert("end", *[sl["name"] for sl in shopping_lists])
         
         # Store shopping list IDs for later
         list_ids = [shopping_list["id"] for shopping_list in shopping_lists]
@@ -2717,20 +2990,14 @@ class RecipeApp:
                 if not file_path:
                     return  # User cancelled
                 
-                try:
-                    # Export selected shopping lists
-                    lists_to_export = self.db.export_shopping_lists_to_json(selected_list_ids)
-                    
-                    # Write to file
-                    with open(file_path, 'w') as f:
-                        json.dump(lists_to_export, f, indent=4)
-                    
-                    messagebox.showinfo(
-                        "Export Successful", 
-                        f"Successfully exported {len(lists_to_export)} shopping lists to {file_path}"
-                    )
-                except Exception as e:
-                    messagebox.showerror("Export Error", f"Error exporting shopping lists: {str(e)}")
+                # Export selected shopping lists; the file write happens
+                # off the Tk thread
+                lists_to_export = self.db.export_shopping_lists_to_json(selected_list_ids)
+                self._write_json_async(
+                    lists_to_export, file_path,
+                    f"Successfully exported {len(lists_to_export)} shopping lists to {file_path}",
+                    "Error exporting shopping lists"
+                )
         
         # Export button
         export_btn = ctk.CTkButton(
@@ -2755,8 +3022,6 @@ class RecipeApp:
 
     def import_recipes(self):
         """Import recipes from a JSON file."""
-        import json
-        import tkinter.filedialog as filedialog
         
         # Ask user for file location
         file_path = filedialog.askopenfilename(
@@ -2769,19 +3034,15 @@ class RecipeApp:
         
         try:
             # Read from file
-            with open(file_path, 'r') as f:
-                recipes_data = json.load(f)
+            recipes_data = read_json_file(file_path)
             
             # Validate data is a list
             if not isinstance(recipes_data, list):
                 messagebox.showerror("Import Error", "Invalid JSON format. Expected a list of recipes.")
                 return
             
-            # Import recipes
-            imported_count = 0
-            for recipe_data in recipes_data:
-                if self.db.import_recipe_from_json(recipe_data):
-                    imported_count += 1
+            # Import recipes in a single transaction
+            imported_count = self.db.import_recipes_from_json(recipes_data)
             
             messagebox.showinfo(
                 "Import Successful", 
@@ -2798,8 +3059,6 @@ class RecipeApp:
 
     def import_shopping_lists(self):
         """Import shopping lists from a JSON file."""
-        import json
-        import tkinter.filedialog as filedialog
         
         # Ask user for file location
         file_path = filedialog.askopenfilename(
@@ -2812,19 +3071,15 @@ class RecipeApp:
         
         try:
             # Read from file
-            with open(file_path, 'r') as f:
-                lists_data = json.load(f)
+            lists_data = read_json_file(file_path)
             
             # Validate data is a list
             if not isinstance(lists_data, list):
                 messagebox.showerror("Import Error", "Invalid JSON format. Expected a list of shopping lists.")
                 return
             
-            # Import shopping lists
-            imported_count = 0
-            for list_data in lists_data:
-                if self.db.import_shopping_list_from_json(list_data):
-                    imported_count += 1
+            # Import shopping lists in a single transaction
+            imported_count = self.db.import_shopping_lists_from_json(lists_data)
             
             messagebox.showinfo(
                 "Import Successful", 
@@ -2839,14 +3094,109 @@ class RecipeApp:
         except Exception as e:
             messagebox.showerror("Import Error", f"Error importing shopping lists: {str(e)}")
 
+    def _write_json_async(self, data, file_path, success_msg, error_prefix):
+        """Write a JSON export off the Tk thread, reporting via after().
+
+        The data is already fully materialized, so the worker only does
+        serialization and file I/O; message boxes are marshalled back to
+        the main thread.
+        """
+        def do_write():
+            try:
+                write_json_file(data, file_path)
+            except Exception as e:
+                # Build the message now: the except variable is unbound once
+                # this block exits, long before after() runs the callback
+                msg = f"{error_prefix}: {str(e)}"
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Export Error", msg
+                ))
+            else:
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Export Successful", success_msg
+                ))
+
+        threading.Thread(target=do_write, daemon=True).start()
+
+    def backup_database(self):
+        """Back up the database to a file chosen by the user."""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".db",
+            filetypes=[("SQLite database", "*.db"), ("All files", "*.*")],
+            title="Backup Database"
+        )
+
+        if not file_path:
+            return  # User cancelled
+
+        # The online backup runs off the Tk thread so the UI stays live;
+        # results come back via after()
+        def do_backup():
+            try:
+                self.db.backup_to(file_path)
+            except Exception as e:
+                # Build the message now: the except variable is unbound once
+                # this block exits, long before after() runs the callback
+                msg = f"Error backing up database: {str(e)}"
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Backup Error", msg
+                ))
+            else:
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Backup Successful", f"Database backed up to {file_path}"
+                ))
+
+        threading.Thread(target=do_backup, daemon=True).start()
+
+    def restore_database(self):
+        """Restore the database from a backup file."""
+        confirm = messagebox.askyesno(
+            "Confirm Restore",
+            "Restoring replaces all current data with the backup's contents. Continue?"
+        )
+
+        if not confirm:
+            return
+
+        file_path = filedialog.askopenfilename(
+            filetypes=[("SQLite database", "*.db"), ("All files", "*.*")],
+            title="Restore Database"
+        )
+
+        if not file_path:
+            return  # User cancelled
+
+        # Flush queued writes, then restore synchronously so no edits can
+        # interleave with the page copy
+        self._flush_check_updates()
+
+        try:
+            self.db.restore_from(file_path)
+        except Exception as e:
+            messagebox.showerror("Restore Error", f"Error restoring database: {str(e)}")
+            return
+
+        # Refresh every view that shows database contents
+        self.load_recipe_list()
+        self.load_shopping_lists()
+        messagebox.showinfo("Restore Successful", "Database restored successfully!")
+
+    def on_close(self):
+        """Flush pending work and shut the application down."""
+        self._flush_check_updates()
+        self.root.destroy()
+
     def run(self):
         """Run the application."""
         # Create widgets
         self.create_widgets()
-        
+
+        # Flush queued writes before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Start main loop
         self.root.mainloop()
-        
+
         # Close database when app closes
         self.db.close()
 